@@ -0,0 +1,59 @@
+"""argparse definition for the klaus-kode CLI.
+
+Only imported when cli._fast_parse_args() can't handle the command line
+(--help, usage errors), so plain runs never load argparse.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; repeated main() calls reuse it."""
+    parser = argparse.ArgumentParser(
+        prog="klaus-kode",
+        description="Donate your Claude credits to open source by working on GitHub issues.",
+    )
+    parser.add_argument(
+        "--repo",
+        default=None,
+        help="GitHub repository in owner/repo format",
+    )
+    parser.add_argument(
+        "--find-repo",
+        type=str,
+        default=None,
+        help="Search GitHub for a repository matching this description (e.g. 'python web framework')",
+    )
+    issue_group = parser.add_mutually_exclusive_group(required=False)
+    issue_group.add_argument(
+        "--issue",
+        type=int,
+        help="Issue number to work on",
+    )
+    issue_group.add_argument(
+        "--find",
+        type=str,
+        help="Search open issues and pick one matching this description (e.g. 'easy', 'documentation fix')",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="Maximum USD budget for Claude API usage (only applies with ANTHROPIC_API_KEY)",
+    )
+    parser.add_argument(
+        "--force-check",
+        action="store_true",
+        help="Always re-check GitHub authentication, even if it passed recently",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="count",
+        default=0,
+        help="Increase output verbosity (-v for details, -vv for full output)",
+    )
+    return parser
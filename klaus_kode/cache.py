@@ -0,0 +1,100 @@
+"""Best-effort on-disk cache shared across runs.
+
+Entries live under ~/.cache/klaus-kode (or $XDG_CACHE_HOME/klaus-kode).
+Every helper swallows OSError so a missing or read-only cache directory
+never breaks a run — it just behaves like a cache miss.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import time
+from typing import Any, Callable
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "klaus-kode",
+)
+
+
+def cache_path(name: str) -> str:
+    """Return the absolute path of a cache entry."""
+    return os.path.join(CACHE_DIR, name)
+
+
+def is_fresh(name: str, ttl: float) -> bool:
+    """Return True if the entry exists and was touched less than ``ttl`` seconds ago."""
+    try:
+        return time.time() - os.path.getmtime(cache_path(name)) < ttl
+    except OSError:
+        return False
+
+
+def touch(name: str) -> None:
+    """Create the entry if needed and bump its mtime to now."""
+    path = cache_path(name)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, "a"):
+            pass
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def read_json(name: str) -> dict | None:
+    """Return the decoded entry, or None if it is missing or unreadable."""
+    try:
+        with open(cache_path(name)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_json(name: str, data: dict) -> None:
+    """Atomically replace the entry with ``data`` encoded as JSON."""
+    path = cache_path(name)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def disk_memoize(
+    ttl: float,
+    encode: Callable[[Any], Any] = _identity,
+    decode: Callable[[Any], Any] = _identity,
+) -> Callable:
+    """Cache a function's JSON-serializable result on disk for ``ttl`` seconds.
+
+    Keyed on the function name and arguments. Falsy results (failures, empty
+    lists) are never stored, so callers that poll until something appears
+    always hit the network. ``encode``/``decode`` convert non-JSON results.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = json.dumps([args, sorted(kwargs.items())], default=str)
+            name = f"memo_{fn.__name__}_{hashlib.sha256(key.encode()).hexdigest()[:16]}.json"
+            if is_fresh(name, ttl):
+                entry = read_json(name)
+                if entry is not None and "value" in entry:
+                    return decode(entry["value"])
+            value = fn(*args, **kwargs)
+            if value:
+                write_json(name, {"value": encode(value)})
+            return value
+        return wrapper
+    return decorator
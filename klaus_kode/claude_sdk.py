@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import itertools
 import json
 import random
 import sys
+import threading
 import time
 from typing import TYPE_CHECKING
 
@@ -40,6 +43,30 @@ if TYPE_CHECKING:
 REPO_PATH = "/workspace/repo"
 
 
+# ---------------------------------------------------------------------------
+# Event loop reuse
+# ---------------------------------------------------------------------------
+
+# One long-lived loop per thread: the pipeline makes several Claude calls (some
+# from pool threads), and asyncio.run() would build and tear down a loop each time
+_loops = threading.local()
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    if not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def run_sync(coro):
+    """Run a coroutine to completion on this thread's event loop."""
+    loop = getattr(_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _loops.loop = asyncio.new_event_loop()
+        atexit.register(_close_loop, loop)
+    return loop.run_until_complete(coro)
+
+
 # ---------------------------------------------------------------------------
 # Quick one-shot Claude helper (for utility functions)
 # ---------------------------------------------------------------------------
@@ -83,7 +110,7 @@ def quick_claude_sync(
     output_format: dict | None = None,
 ) -> str:
     """Synchronous wrapper around _quick_claude."""
-    return asyncio.run(_quick_claude(prompt, model=model, output_format=output_format))
+    return run_sync(_quick_claude(prompt, model=model, output_format=output_format))
 
 
 # ---------------------------------------------------------------------------
@@ -109,8 +136,9 @@ async def _run_claude_streaming_async(
     Returns the final text output from Claude.
 
     Args:
-        start_time_global: Global pipeline start time for total elapsed display.
-            Replaces the old _global_start module variable.
+        start_time_global: Global pipeline start time (a time.monotonic()
+            reading) for total elapsed display. Replaces the old _global_start
+            module variable.
     """
     if logger:
         logger.log_step_start(step_name or activity, prompt=prompt, max_turns=max_turns)
@@ -136,10 +164,10 @@ async def _run_claude_streaming_async(
     if mcp_servers:
         options.mcp_servers = mcp_servers
 
-    start_time = time.time()
-    spinner_idx = 0
+    start_time = time.monotonic()
+    spinner = itertools.cycle(SPINNER_CHARS)
     verb_idx = random.randint(0, len(STATUS_VERBS) - 1)
-    last_verb_change = time.time()
+    last_verb_change = time.monotonic()
     last_spinner_line = ""
     final_output = ""
 
@@ -149,11 +177,11 @@ async def _run_claude_streaming_async(
     error_summaries: list[dict] = []
 
     def _elapsed() -> str:
-        return f"{int(time.time() - start_time)}s"
+        return f"{int(time.monotonic() - start_time)}s"
 
     def _total_elapsed() -> str:
         if start_time_global is not None:
-            return f"{int(time.time() - start_time_global)}s"
+            return f"{int(time.monotonic() - start_time_global)}s"
         return _elapsed()
 
     def _clear_spinner():
@@ -164,10 +192,8 @@ async def _run_claude_streaming_async(
             last_spinner_line = ""
 
     def _show_spinner(verb: str):
-        nonlocal spinner_idx, last_spinner_line
-        ch = SPINNER_CHARS[spinner_idx % len(SPINNER_CHARS)]
-        spinner_idx += 1
-        line = f"  {CYAN}{ch} {verb}... ({_elapsed()} {activity} | total {_total_elapsed()}){RESET}"
+        nonlocal last_spinner_line
+        line = f"  {CYAN}{next(spinner)} {verb}... ({_elapsed()} {activity} | total {_total_elapsed()}){RESET}"
         sys.stdout.write(f"\r\033[2K{line}")
         sys.stdout.flush()
         last_spinner_line = line
@@ -181,17 +207,17 @@ async def _run_claude_streaming_async(
     try:
         async for msg in query(prompt=prompt, options=options):
             # Rotate verb periodically
-            if time.time() - last_verb_change > 5:
+            if time.monotonic() - last_verb_change > 5:
                 verb_idx = (verb_idx + 1) % len(STATUS_VERBS)
-                last_verb_change = time.time()
+                last_verb_change = time.monotonic()
 
             if isinstance(msg, AssistantMessage):
                 for block in msg.content:
                     if isinstance(block, TextBlock):
                         text = block.text.strip()
                         if text:
-                            for tl in text.splitlines():
-                                _print_line(f"  {CYAN}{tl}{RESET}")
+                            # One write + flush per block rather than per line
+                            _print_line("\n".join(f"  {CYAN}{tl}{RESET}" for tl in text.splitlines()))
                             if logger:
                                 logger.log_text_block(text)
                     elif isinstance(block, ToolUseBlock):
@@ -247,8 +273,7 @@ async def _run_claude_streaming_async(
                 )
                 if final_output.strip() and verbose >= 1:
                     _print_line(f"  {DIM}--- Final output ---{RESET}")
-                    for fl in final_output.strip().splitlines():
-                        _print_line(f"  {fl}")
+                    _print_line("\n".join(f"  {fl}" for fl in final_output.strip().splitlines()))
 
             elif isinstance(msg, SystemMessage):
                 if verbose >= 2:
@@ -264,7 +289,7 @@ async def _run_claude_streaming_async(
     finally:
         _clear_spinner()
 
-    step_duration = round(time.time() - start_time, 1)
+    step_duration = round(time.monotonic() - start_time, 1)
 
     # Log to RunLogger
     if logger:
@@ -307,7 +332,7 @@ def run_claude_streaming(
     start_time_global: float | None = None,
 ) -> str:
     """Synchronous wrapper around _run_claude_streaming_async."""
-    return asyncio.run(_run_claude_streaming_async(
+    return run_sync(_run_claude_streaming_async(
         prompt=prompt,
         header=header,
         activity=activity,
@@ -2,25 +2,43 @@
 
 from __future__ import annotations
 
-import argparse
 import os
-import subprocess
 import sys
 import time
-
-from klaus_kode import github
-from klaus_kode.context import PipelineContext, Session
-from klaus_kode.github import (
-    check_gh_auth,
-    check_issue_active_work,
-    check_token_scopes,
-    fetch_issue,
-    fork_repo,
-    search_issues,
-    search_repos,
-    validate_repo,
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Literal
+
+# Pipeline modules are imported where they're first needed, so --help and
+# argument errors don't pay for them
+if TYPE_CHECKING:
+    import argparse
+
+    from klaus_kode.context import PipelineContext
+    from klaus_kode.github import Issue
+
+# Claude credentials don't change during a run, so resolve them once at import
+_HAS_API_KEY = bool(os.environ.get("ANTHROPIC_API_KEY"))
+_CLAUDE_AUTH: Literal["oauth", "apikey", "none"] = (
+    "oauth" if os.environ.get("CLAUDE_CODE_OAUTH_TOKEN")
+    else "apikey" if _HAS_API_KEY
+    else "none"
 )
-from klaus_kode.run_logger import RunLogger
+_CLAUDE_AUTH_LABELS = {"oauth": "OAuth token", "apikey": "API key"}
+
+# A successful prerequisite check is trusted for this long for the same tokens
+_AUTH_CACHE_TTL = 10 * 60
+
+
+def _auth_fingerprint() -> str:
+    """Short hash of the configured credentials, used to key the auth cache."""
+    import hashlib  # pulls in OpenSSL; only needed once the pipeline starts
+
+    tokens = (
+        os.environ.get("GH_TOKEN", "")
+        + os.environ.get("CLAUDE_CODE_OAUTH_TOKEN", "")
+        + os.environ.get("ANTHROPIC_API_KEY", "")
+    )
+    return hashlib.sha256(tokens.encode()).hexdigest()[:16]
 
 
 # ---------------------------------------------------------------------------
@@ -29,15 +47,22 @@ from klaus_kode.run_logger import RunLogger
 
 def _check_prerequisites(ctx: PipelineContext) -> PipelineContext:
     """Verify all prerequisites are met."""
+    from klaus_kode import cache
+    from klaus_kode.github import check_gh_auth, check_token_scopes
+
     print("Checking prerequisites...")
 
-    # Check GitHub auth
-    print("  Checking GitHub authentication...")
-    if not check_gh_auth():
-        print("Error: No GitHub authentication found.", file=sys.stderr)
-        print("Set the GH_TOKEN environment variable.", file=sys.stderr)
-        raise SystemExit(1)
-    print("  GitHub: OK")
+    # Check GitHub auth (skipped if the same tokens passed recently)
+    auth_marker = f"auth_ok_{_auth_fingerprint()}"
+    if not ctx.force_check and cache.is_fresh(auth_marker, _AUTH_CACHE_TTL):
+        print("  GitHub: OK (cached)")
+    else:
+        print("  Checking GitHub authentication...")
+        if not check_gh_auth():
+            print("Error: No GitHub authentication found.", file=sys.stderr)
+            print("Set the GH_TOKEN environment variable.", file=sys.stderr)
+            raise SystemExit(1)
+        print("  GitHub: OK")
 
     # Check token permissions
     if ctx.verbose:
@@ -54,21 +79,23 @@ def _check_prerequisites(ctx: PipelineContext) -> PipelineContext:
 
     # Check Claude auth
     print("  Checking Claude authentication...")
-    has_oauth = bool(os.environ.get("CLAUDE_CODE_OAUTH_TOKEN"))
-    has_api_key = bool(os.environ.get("ANTHROPIC_API_KEY"))
-    if not has_oauth and not has_api_key:
+    if _CLAUDE_AUTH == "none":
         print("Error: No Claude authentication found.", file=sys.stderr)
         print("Set one of: CLAUDE_CODE_OAUTH_TOKEN or ANTHROPIC_API_KEY.", file=sys.stderr)
         print("Create an API key at: https://console.anthropic.com/settings/keys", file=sys.stderr)
         raise SystemExit(1)
-    auth_method = "OAuth token" if has_oauth else "API key"
-    print(f"  Claude: OK ({auth_method})")
+    print(f"  Claude: OK ({_CLAUDE_AUTH_LABELS[_CLAUDE_AUTH]})")
+    if ctx.max_budget_usd is not None and not _HAS_API_KEY:
+        print("  WARNING: --budget only applies with ANTHROPIC_API_KEY; it won't be enforced.", file=sys.stderr)
 
+    cache.touch(auth_marker)
     return ctx
 
 
 def _find_repo(ctx: PipelineContext) -> PipelineContext:
     """Find a repo if --find-repo was used, otherwise validate --repo."""
+    from klaus_kode.github import fetch_issue_full, search_issues, search_repos, validate_repo
+
     if ctx.find_repo:
         print(f"\nSearching GitHub for repos matching: '{ctx.find_repo}'...")
         ctx.candidates_repos = search_repos(ctx.find_repo)
@@ -76,8 +103,16 @@ def _find_repo(ctx: PipelineContext) -> PipelineContext:
             print("Error: No repositories found.", file=sys.stderr)
             raise SystemExit(1)
         print(f"  Found {len(ctx.candidates_repos)} candidate repos:")
-        for i, r in enumerate(ctx.candidates_repos, 1):
-            print(f"    {i}. {r.full_name} ({r.language}, {r.stars}\u2605) \u2014 {r.description[:80]}")
+        print("\n".join(
+            f"    {i}. {r.full_name} ({r.language}, {r.stars}\u2605) \u2014 {r.description[:80]}"
+            for i, r in enumerate(ctx.candidates_repos, 1)
+        ))
+
+        # Prefetch every candidate's open issues while Claude picks a repo;
+        # the chosen one feeds _find_issue and the rest serve as fallbacks
+        for r in ctx.candidates_repos:
+            if r.full_name not in ctx.repo_issue_futures:
+                ctx.repo_issue_futures[r.full_name] = ctx.pool.submit(search_issues, r.full_name)
 
         from klaus_kode.selection import pick_repo
         chosen = pick_repo(ctx.candidates_repos, ctx.find_repo, logger=ctx.logger)
@@ -91,8 +126,15 @@ def _find_repo(ctx: PipelineContext) -> PipelineContext:
 
     ctx.logger.set_context(repo=ctx.repo)
 
-    # Validate repo
+    # Validate repo. The issue lookup for the next step starts speculatively
+    # alongside it and is discarded if validation fails.
     print(f"\nValidating repo {ctx.repo}...")
+    if ctx.issue_number is not None:
+        ctx.issue_future = ctx.pool.submit(fetch_issue_full, ctx.repo, ctx.issue_number)
+    else:
+        ctx.candidates_future = (
+            ctx.repo_issue_futures.get(ctx.repo) or ctx.pool.submit(search_issues, ctx.repo)
+        )
     if not validate_repo(ctx.repo):
         print(f"Error: Repository '{ctx.repo}' not found.", file=sys.stderr)
         raise SystemExit(1)
@@ -102,10 +144,20 @@ def _find_repo(ctx: PipelineContext) -> PipelineContext:
 
 def _find_issue(ctx: PipelineContext) -> PipelineContext:
     """Fetch or find an issue to work on."""
+    from klaus_kode.github import (
+        bulk_active_work,
+        check_issue_active_work,
+        fetch_issue_full,
+        search_issues,
+    )
+
     if ctx.issue_number is not None:
         # Explicit issue number
         print(f"Fetching issue #{ctx.issue_number}...")
-        issue = fetch_issue(ctx.repo, ctx.issue_number)
+        if ctx.issue_future is not None:
+            issue = ctx.issue_future.result()
+        else:
+            issue = fetch_issue_full(ctx.repo, ctx.issue_number)
         if issue is None:
             raise SystemExit(1)
         if issue.state != "open":
@@ -118,9 +170,10 @@ def _find_issue(ctx: PipelineContext) -> PipelineContext:
         if ctx.verbose and issue.labels:
             print(f"  Labels: {', '.join(issue.labels)}")
 
-        # Check if issue is already being worked on
+        # Check if issue is already being worked on (assignees and linked PRs
+        # came back with the issue itself, so this makes no API calls)
         print(f"Checking if issue #{ctx.issue_number} is already being worked on...")
-        is_active, reason = check_issue_active_work(ctx.repo, issue)
+        is_active, reason = check_issue_active_work(ctx.repo, issue, executor=ctx.pool)
         if is_active:
             print(f"Skipping issue #{ctx.issue_number}: {reason}", file=sys.stderr)
             raise SystemExit(1)
@@ -129,50 +182,52 @@ def _find_issue(ctx: PipelineContext) -> PipelineContext:
         # Use --find description or default to easy beginner-friendly issues
         find_description = ctx.find_description or "easy beginner-friendly good first issue"
         print(f"Searching open issues in {ctx.repo} matching: '{find_description}'...")
-        candidates = search_issues(ctx.repo)
-
-        # If no issues found and we came from --find-repo, try remaining candidates
+        if ctx.candidates_future is not None:
+            candidates = ctx.candidates_future.result()
+        else:
+            candidates = search_issues(ctx.repo)
+
+        # If no issues found and we came from --find-repo, probe the remaining
+        # candidates concurrently and take the highest-ranked one that has open
+        # issues. search_issues succeeding implies the repo exists, so no
+        # validate_repo.
         if not candidates and ctx.candidates_repos:
-            tried = {ctx.repo}
-            for fallback_repo in ctx.candidates_repos:
-                if fallback_repo.full_name in tried:
-                    continue
-                tried.add(fallback_repo.full_name)
-                print(f"  No open issues in {ctx.repo}, trying {fallback_repo.full_name}...")
-                if not validate_repo(fallback_repo.full_name):
-                    continue
-                candidates = search_issues(fallback_repo.full_name)
-                if candidates:
-                    ctx.repo = fallback_repo.full_name
-                    ctx.logger.set_context(repo=ctx.repo)
-                    print(f"  Switched to repo: {ctx.repo}")
-                    break
+            fallbacks = [
+                name for name in dict.fromkeys(r.full_name for r in ctx.candidates_repos)
+                if name != ctx.repo
+            ]
+            if fallbacks:
+                print(f"  No open issues in {ctx.repo}, trying {', '.join(fallbacks)}...")
+                futures = [
+                    ctx.repo_issue_futures.get(name) or ctx.pool.submit(search_issues, name)
+                    for name in fallbacks
+                ]
+                for i, (name, future) in enumerate(zip(fallbacks, futures)):
+                    found = future.result()
+                    if found:
+                        for pending in futures[i + 1:]:
+                            pending.cancel()
+                        candidates = found
+                        ctx.repo = name
+                        ctx.logger.set_context(repo=ctx.repo)
+                        print(f"  Switched to repo: {ctx.repo}")
+                        break
 
         if not candidates:
             print("Error: No open issues found.", file=sys.stderr)
             raise SystemExit(1)
         print(f"  Found {len(candidates)} open issues, filtering...")
 
-        # Labels that indicate non-coding issues
-        non_coding_labels = {
-            "question", "discussion", "support",
-            "wontfix", "won't fix", "duplicate", "invalid",
-            "needs info", "needs-info", "needs more info",
-            "waiting for response", "waiting-for-response",
-        }
-
-        # Filter out non-coding issues and issues already being worked on
-        available: list[github.Issue] = []
-        for candidate in candidates:
-            # Skip issues with non-coding labels
-            candidate_labels = {label.lower() for label in candidate.labels}
-            skipped_labels = candidate_labels & non_coding_labels
-            if skipped_labels:
-                if ctx.verbose:
-                    print(f"  Skipping #{candidate.number}: non-coding label(s): {', '.join(skipped_labels)}")
-                continue
-
-            is_active, reason = check_issue_active_work(ctx.repo, candidate)
+        # search_issues normally returns assignees and linked PRs already; if
+        # it fell back to REST, fetch them for all candidates in one request.
+        # Either way the checks are then local — only issues the bulk query
+        # missed hit the API.
+        # map() keeps candidate order, and skip messages are printed after the
+        # join so they don't interleave
+        bulk_active_work(ctx.repo, candidates)
+        checks = ctx.pool.map(lambda c: check_issue_active_work(ctx.repo, c), candidates)
+        available: list[Issue] = []
+        for candidate, (is_active, reason) in zip(candidates, checks):
             if not is_active:
                 available.append(candidate)
             elif ctx.verbose:
@@ -204,21 +259,25 @@ def _find_issue(ctx: PipelineContext) -> PipelineContext:
 
 def _fork_and_clone(ctx: PipelineContext) -> PipelineContext:
     """Fork the repo, clone it, and read contributing guidelines."""
-    from klaus_kode.repo_ops import clone_repo, read_contributing_guidelines
+    from klaus_kode.github import fork_repo
+    from klaus_kode.repo_ops import attach_fork, clone_upstream, read_contributing_guidelines
 
-    # Fork repo
+    # Fork in the background: GitHub can take several seconds to make the
+    # fork available, and the clone of upstream doesn't need it
     print(f"\nForking {ctx.repo}...")
-    ctx.fork = fork_repo(ctx.repo)
-    print(f"  Fork: {ctx.fork}")
-    ctx.logger.set_context(fork=ctx.fork)
+    fork_future = ctx.pool.submit(fork_repo, ctx.repo)
 
-    # Clone repo
     print("\nSetting up repository...")
-    ctx.default_branch = clone_repo(ctx.repo, ctx.fork, logger=ctx.logger)
+    ctx.default_branch = clone_upstream(ctx.repo, logger=ctx.logger)
 
     # Read contributing guidelines
     ctx.guidelines = read_contributing_guidelines()
 
+    ctx.fork = fork_future.result()
+    print(f"  Fork: {ctx.fork}")
+    ctx.logger.set_context(fork=ctx.fork)
+    attach_fork(ctx.fork, logger=ctx.logger)
+
     return ctx
 
 
@@ -227,7 +286,7 @@ def _prepare_branch(ctx: PipelineContext) -> PipelineContext:
     from klaus_kode.repo_ops import create_branch, gather_repo_context, write_inner_claude_md
     from klaus_kode.selection import parallel_pre_work
 
-    # Suggest branch name + check guidelines compliance (parallel)
+    # Suggest branch name + check guidelines compliance (one Claude call)
     print("\n[6/9] Checking guidelines and suggesting branch name...")
     ctx.branch_name, should_proceed = parallel_pre_work(ctx.issue, ctx.guidelines)
     print(f"  Branch name: {ctx.branch_name}")
@@ -238,12 +297,14 @@ def _prepare_branch(ctx: PipelineContext) -> PipelineContext:
     # Create branch
     create_branch(ctx.branch_name, ctx.default_branch)
 
-    # Write inner CLAUDE.md for the target repo
+    # Write inner CLAUDE.md for the target repo. This comes before the scan
+    # below, so the file tree always lists it and the context stays stable.
     write_inner_claude_md(ctx.issue, ctx.repo, ctx.guidelines, ctx.branch_name)
 
-    # Pre-fetch repo context to reduce Claude's exploration overhead
+    # Pre-fetch repo context to reduce Claude's exploration overhead. The scan
+    # runs in the background; _run_work only waits on it when building the prompt.
     print("  Pre-fetching repository context...")
-    ctx.repo_context = gather_repo_context()
+    ctx.repo_context_future = ctx.pool.submit(gather_repo_context)
 
     return ctx
 
@@ -254,6 +315,8 @@ def _run_work(ctx: PipelineContext) -> PipelineContext:
     from klaus_kode.prompts import WORK_TOOLS, WORKER_SYSTEM_PROMPT, build_work_prompt
     from klaus_kode.repo_ops import cleanup_inner_claude_md, commit_changes
 
+    if ctx.repo_context_future is not None:
+        ctx.repo_context = ctx.repo_context_future.result()
     prompt = build_work_prompt(ctx.issue, ctx.repo, ctx.guidelines, repo_context=ctx.repo_context)
     run_claude_streaming(
         prompt=prompt,
@@ -271,24 +334,21 @@ def _run_work(ctx: PipelineContext) -> PipelineContext:
 
     # Clean up inner CLAUDE.md and ensure changes are committed
     cleanup_inner_claude_md()
-    if not commit_changes(ctx.issue.number, ctx.default_branch, logger=ctx.logger):
+    # The diff is captured once here for reuse in review + PR description
+    committed, ctx.diff_output = commit_changes(
+        ctx.issue.number, ctx.default_branch, logger=ctx.logger, return_diff=True,
+    )
+    if not committed:
         print("No changes were made. Nothing to push.", file=sys.stderr)
         raise SystemExit(1)
 
-    # Capture diff once for reuse in review + PR description
-    from klaus_kode.repo_ops import REPO_PATH
-    diff_result = subprocess.run(
-        ["git", "--no-pager", "diff", f"upstream/{ctx.default_branch}"],
-        capture_output=True, text=True, cwd=REPO_PATH,
-    )
-    ctx.diff_output = diff_result.stdout[:50000]  # Cap at 50KB
-
     return ctx
 
 
 def _review_and_push(ctx: PipelineContext) -> PipelineContext:
     """Review changes, generate PR description, push, and save."""
     from klaus_kode.pr_description import (
+        description_diff,
         generate_pr_description,
         run_claude_review,
         save_pr_description,
@@ -296,25 +356,38 @@ def _review_and_push(ctx: PipelineContext) -> PipelineContext:
     )
     from klaus_kode.repo_ops import push_branch
 
-    # Show changes to human + self-review with diff injected
-    show_changes(ctx.default_branch)
-    run_claude_review(
-        ctx.default_branch,
-        verbose=ctx.verbose,
-        logger=ctx.logger,
-        max_budget_usd=ctx.max_budget_usd,
-        diff_output=ctx.diff_output,
-        start_time_global=ctx.start_time,
-    )
+    # Show changes to human; on a resumed run this captures the diff too
+    ctx.diff_output = show_changes(ctx.default_branch, diff_output=ctx.diff_output)
 
-    # Generate PR description (reuse captured diff)
-    ctx.pr_title, ctx.pr_body = generate_pr_description(
-        ctx.issue, ctx.repo, ctx.default_branch, diff_output=ctx.diff_output,
+    # Generate the PR description while the review runs. Its diff is settled
+    # here, before the reviewer can touch the working tree, so the
+    # background call only talks to Claude and prints nothing
+    pr_diff = description_diff(ctx.default_branch, ctx.diff_output)
+    description_future = ctx.pool.submit(
+        generate_pr_description,
+        ctx.issue, ctx.repo, ctx.default_branch, diff_output=pr_diff,
     )
 
-    # Push branch
+    # Self-review with diff injected
+    try:
+        run_claude_review(
+            ctx.default_branch,
+            verbose=ctx.verbose,
+            logger=ctx.logger,
+            max_budget_usd=ctx.max_budget_usd,
+            diff_output=ctx.diff_output,
+            start_time_global=ctx.start_time,
+        )
+    except SystemExit:
+        # Rejected: the description is no longer needed
+        description_future.cancel()
+        raise
+
+    # Push branch — only once the review has approved the changes
     push_branch(ctx.branch_name, logger=ctx.logger)
 
+    ctx.pr_title, ctx.pr_body = description_future.result()
+
     # Save PR description and print ready-to-run command
     save_pr_description(
         title=ctx.pr_title,
@@ -343,47 +416,61 @@ PIPELINE: list[tuple[str, callable]] = [
 ]
 
 
-def main(argv: list[str] | None = None) -> None:
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        prog="klaus-kode",
-        description="Donate your Claude credits to open source by working on GitHub issues.",
-    )
-    parser.add_argument(
-        "--repo",
-        default=None,
-        help="GitHub repository in owner/repo format",
-    )
-    parser.add_argument(
-        "--find-repo",
-        type=str,
-        default=None,
-        help="Search GitHub for a repository matching this description (e.g. 'python web framework')",
-    )
-    issue_group = parser.add_mutually_exclusive_group(required=False)
-    issue_group.add_argument(
-        "--issue",
-        type=int,
-        help="Issue number to work on",
-    )
-    issue_group.add_argument(
-        "--find",
-        type=str,
-        help="Search open issues and pick one matching this description (e.g. 'easy', 'documentation fix')",
-    )
-    parser.add_argument(
-        "--budget",
-        type=float,
-        default=None,
-        help="Maximum USD budget for Claude API usage (only applies with ANTHROPIC_API_KEY)",
-    )
-    parser.add_argument(
-        "-v", "--verbose",
-        action="count",
-        default=0,
-        help="Increase output verbosity (-v for details, -vv for full output)",
-    )
-
+# Flags the fast path understands. Anything else goes through argparse.
+_VALUE_FLAGS: dict[str, tuple[str, type]] = {
+    "--repo": ("repo", str),
+    "--find-repo": ("find_repo", str),
+    "--issue": ("issue", int),
+    "--find": ("find", str),
+    "--budget": ("budget", float),
+}
+_BOOL_FLAGS = {"--force-check": "force_check"}
+
+
+def _fast_parse_args(argv: list[str]) -> SimpleNamespace | None:
+    """Parse a plain, valid command line without building an ArgumentParser.
+
+    Returns None for anything else (--help, unknown or repeated flags,
+    --flag=value syntax, invalid combinations) so that _parse_args can
+    produce argparse's usual help and error messages.
+    """
+    args: dict = {
+        "repo": None, "find_repo": None, "issue": None, "find": None,
+        "budget": None, "force_check": False, "verbose": 0,
+    }
+    it = iter(argv)
+    for tok in it:
+        if tok in _VALUE_FLAGS:
+            dest, convert = _VALUE_FLAGS[tok]
+            value = next(it, None)
+            if value is None or value.startswith("-") or args[dest] is not None:
+                return None
+            try:
+                args[dest] = convert(value)
+            except ValueError:
+                return None
+        elif tok in _BOOL_FLAGS:
+            args[_BOOL_FLAGS[tok]] = True
+        elif tok in ("-v", "--verbose"):
+            args["verbose"] += 1
+        elif tok == "-vv":
+            args["verbose"] += 2
+        else:
+            return None
+
+    # Exactly one of --repo/--find-repo; --issue excludes --find and --find-repo
+    if bool(args["repo"]) == bool(args["find_repo"]):
+        return None
+    if args["issue"] is not None and (args["find"] is not None or args["find_repo"]):
+        return None
+    return SimpleNamespace(**args)
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """Full argparse parser: used for --help and to report usage errors."""
+    from klaus_kode._argparser import build_parser
+
+    parser = build_parser()
     args = parser.parse_args(argv)
 
     # Custom validation: --repo and --find-repo are mutually exclusive; one is required
@@ -394,6 +481,18 @@ def main(argv: list[str] | None = None) -> None:
     # --find-repo + --issue is an error (can't know issue numbers for an unknown repo)
     if args.find_repo and args.issue is not None:
         parser.error("--issue cannot be used with --find-repo (issue numbers are repo-specific)")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _fast_parse_args(argv) or _parse_args(argv)
+
+    from klaus_kode import github
+    from klaus_kode.context import PipelineContext, Session
+    from klaus_kode.run_logger import RunLogger
 
     # Set module-level verbosity (backwards compat for github.py)
     github.verbose = args.verbose
@@ -411,6 +510,7 @@ def main(argv: list[str] | None = None) -> None:
         find_description=args.find,
         verbose=args.verbose,
         max_budget_usd=args.budget,
+        force_check=args.force_check,
         logger=logger,
         session=session,
     )
@@ -418,15 +518,21 @@ def main(argv: list[str] | None = None) -> None:
     exit_code = 0
     pr_url = ""
     try:
-        # Run pipeline steps, skipping already-completed ones
-        for step_name, step_fn in PIPELINE:
-            if ctx.session.is_completed(step_name):
-                print(f"  Skipping {step_name} (already completed)")
-                continue
+        # Resume from the first step the session hasn't completed
+        start = next(
+            (i for i, (name, _) in enumerate(PIPELINE) if not ctx.session.is_completed(name)),
+            len(PIPELINE),
+        )
+        if start == len(PIPELINE):
+            print("  All steps already completed")
+        elif start:
+            print(f"  Resuming from {PIPELINE[start][0]} ({start} steps already completed)")
+        for step_name, step_fn in PIPELINE[start:]:
             ctx = step_fn(ctx)
             ctx.session.mark_completed(step_name)
+            logger.flush()
 
-        elapsed = time.time() - ctx.start_time
+        elapsed = time.monotonic() - ctx.start_time
         minutes, seconds = divmod(int(elapsed), 60)
         print(f"\nTotal runtime: {minutes}m {seconds}s")
 
@@ -438,6 +544,10 @@ def main(argv: list[str] | None = None) -> None:
         logger.log_error(e)
         raise
     finally:
+        # Don't wait on background work nobody will read (e.g. a PR
+        # description after a rejected review) before logging the run end
+        ctx.pool.shutdown(wait=False, cancel_futures=True)
+        ctx.session.close()
         logger.log_run_end(exit_code=exit_code, pr_url=pr_url)
         logger.flush_final_summary()
 
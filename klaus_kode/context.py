@@ -5,8 +5,9 @@ from __future__ import annotations
 import json
 import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TextIO
 
 from klaus_kode.github import Issue, Repository
 from klaus_kode.run_logger import RunLogger
@@ -18,11 +19,23 @@ class Session:
 
     Tracks which pipeline steps have completed and their outputs,
     allowing the pipeline to resume from the last successful step.
+
+    Completions are appended to a JSONL log next to ``session_file`` and
+    folded into the ``session_file`` snapshot every ``COMPACT_EVERY`` steps
+    and on close(), so marking a step done doesn't rewrite the whole history.
     """
 
+    COMPACT_EVERY = 50
+
     session_file: str = "/workspace/session.json"
     completed_steps: list[str] = field(default_factory=list)
     step_outputs: dict[str, Any] = field(default_factory=dict)
+    _log: TextIO | None = field(default=None, repr=False, compare=False)
+    _appends: int = field(default=0, repr=False, compare=False)
+
+    @property
+    def log_file(self) -> str:
+        return os.path.splitext(self.session_file)[0] + ".log"
 
     def is_completed(self, step_name: str) -> bool:
         """Check if a step has already been completed."""
@@ -30,37 +43,83 @@ class Session:
 
     def mark_completed(self, step_name: str, outputs: dict | None = None) -> None:
         """Mark a step as completed and optionally store its outputs."""
+        self._apply(step_name, outputs)
+        if self._appends + 1 >= self.COMPACT_EVERY:
+            self.save()
+            return
+        try:
+            if self._log is None:
+                os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+                self._log = open(self.log_file, "a")
+            self._log.write(json.dumps({"step": step_name, "out": outputs}, default=str) + "\n")
+            self._log.flush()
+            self._appends += 1
+        except OSError:
+            pass
+
+    def _apply(self, step_name: str, outputs: dict | None) -> None:
         if step_name not in self.completed_steps:
             self.completed_steps.append(step_name)
         if outputs:
             self.step_outputs[step_name] = outputs
-        self.save()
 
     def save(self) -> None:
-        """Persist session state to disk."""
+        """Persist the full session state to disk and truncate the log."""
         try:
             os.makedirs(os.path.dirname(self.session_file) or ".", exist_ok=True)
             data = {
                 "completed_steps": self.completed_steps,
                 "step_outputs": self.step_outputs,
             }
-            with open(self.session_file, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            # Write-then-rename so a crash mid-save can't leave a truncated
+            # file that would make the next run start over
+            tmp = self.session_file + ".tmp"
+            with open(tmp, "w") as f:
+                f.write(json.dumps(data, separators=(",", ":"), default=str))
+            os.replace(tmp, self.session_file)
+            # Everything in the log is now in the snapshot
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            if os.path.exists(self.log_file):
+                os.remove(self.log_file)
+            self._appends = 0
         except OSError:
             pass
 
+    def close(self) -> None:
+        """Fold any logged completions into the snapshot and close the log."""
+        if self._appends:
+            self.save()
+        elif self._log is not None:
+            self._log.close()
+            self._log = None
+
     @classmethod
     def load(cls, path: str = "/workspace/session.json") -> Session:
         """Load session state from disk, or return a fresh session."""
+        session = cls(session_file=path)
         try:
             with open(path) as f:
                 data = json.load(f)
-            session = cls(session_file=path)
             session.completed_steps = data.get("completed_steps", [])
             session.step_outputs = data.get("step_outputs", {})
-            return session
         except (OSError, json.JSONDecodeError):
-            return cls(session_file=path)
+            pass
+        # Replay completions logged since the last snapshot; a torn last line
+        # from a crash is skipped
+        try:
+            with open(session.log_file) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    session._apply(entry["step"], entry.get("out"))
+                    session._appends += 1
+        except OSError:
+            pass
+        return session
 
 
 @dataclass
@@ -77,16 +136,22 @@ class PipelineContext:
     find_description: str | None = None
     verbose: int = 0
     max_budget_usd: float | None = None
+    force_check: bool = False
 
     # Computed during pipeline
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)  # immune to wall-clock jumps
     candidates_repos: list[Repository] | None = None
+    issue_future: Future[Issue | None] | None = None
+    candidates_future: Future[list[Issue]] | None = None
+    # search_issues() per --find-repo candidate, started while Claude picks one
+    repo_issue_futures: dict[str, Future[list[Issue]]] = field(default_factory=dict)
     issue: Issue | None = None
     fork: str | None = None
     default_branch: str | None = None
     branch_name: str | None = None
     guidelines: str = ""
     repo_context: str = ""
+    repo_context_future: Future[str] | None = None
     diff_output: str = ""
     pr_title: str = ""
     pr_body: str = ""
@@ -94,3 +159,7 @@ class PipelineContext:
     # Infrastructure
     logger: RunLogger = field(default_factory=RunLogger)
     session: Session = field(default_factory=Session)
+    # Shared by every step that fans out work; shut down by cli.main()
+    pool: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(max_workers=16, thread_name_prefix="klaus"),
+    )
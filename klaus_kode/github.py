@@ -1,21 +1,28 @@
-"""GitHub operations via the `gh` CLI.
+"""GitHub operations via the REST and GraphQL APIs.
 
-The `gh` CLI is always available inside the Docker container.
+Requests go straight to api.github.com over kept-alive HTTPS connections
+authenticated with GH_TOKEN, rather than through a `gh` subprocess per call.
 """
 
 from __future__ import annotations
 
+import http.client
 import json
 import os
+import random
 import re
-import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from urllib.parse import quote
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from klaus_kode import cache
 
 # Module-level verbosity level — kept for backwards compat but prefer passing
-# verbose as a parameter to _run_gh() directly.
+# verbose as a parameter to _api() directly.
 verbose = 0
 
 
@@ -26,6 +33,9 @@ class Issue:
     body: str
     labels: list[str]
     state: str = "open"
+    # Filled in by fetch_issue_full(); None means "not fetched yet"
+    assignees: list[str] | None = None
+    linked_prs: list[dict] | None = None
 
 
 @dataclass
@@ -38,41 +48,285 @@ class Repository:
     topics: list[str]
 
 
-def _run_gh(*args: str, check: bool = True, verbose: int | None = None) -> subprocess.CompletedProcess[str]:
-    """Run a `gh` CLI command.
+# Read-only lookups are reused across runs for this long (see cache.disk_memoize)
+_LOOKUP_TTL = 5 * 60
+
+
+def _encode_issue(issue: Issue) -> dict:
+    # Assignees and linked PRs are left out: a claim made since the entry was
+    # written must not slip past the active-work check, so they're re-fetched
+    return {**asdict(issue), "assignees": None, "linked_prs": None}
+
+
+def _decode_issue(data: dict) -> Issue:
+    return Issue(**data)
+
+
+def _encode_list(items: list) -> list[dict]:
+    return [asdict(item) for item in items]
+
+
+def _encode_issues(issues: list[Issue]) -> list[dict]:
+    return [_encode_issue(issue) for issue in issues]
+
+
+def _decode_issues(data: list[dict]) -> list[Issue]:
+    return [Issue(**item) for item in data]
+
+
+def _decode_repos(data: list[dict]) -> list[Repository]:
+    return [Repository(**item) for item in data]
+
+
+class _RateLimiter:
+    """Thread-safe token bucket shared by every caller of one GitHub API.
+
+    Holds up to ``capacity`` permits and refills at ``capacity / period``
+    permits per second, so concurrent callers self-pace to the limit instead
+    of tripping 403s.
+    """
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self._capacity = capacity
+        self._rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a permit is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+# GitHub allows 30 search requests per minute and 5000 core requests per hour
+_SEARCH_LIMITER = _RateLimiter(30, 60)
+_CORE_LIMITER = _RateLimiter(5000, 3600)
+
+
+def _limiter_for(path: str) -> _RateLimiter:
+    """Pick the rate-limit bucket an API path counts against."""
+    if path.lstrip("/").startswith("search/"):
+        return _SEARCH_LIMITER
+    return _CORE_LIMITER
+
+
+_API_HOST = "api.github.com"
+
+# http.client connections aren't thread-safe, so each thread keeps its own
+_connections = threading.local()
+
+# Short-lived cache of successful GET responses, so back-to-back lookups of
+# the same resource (fetch_issue then check_issue_active_work) cost one request
+_GET_CACHE_TTL = 90
+_get_cache: dict[tuple, tuple[float, "_ApiResponse"]] = {}
+_get_cache_lock = threading.Lock()
+
+
+def _invalidate_cached(path: str) -> None:
+    """Drop cached GETs at or under ``path`` after a write to it."""
+    with _get_cache_lock:
+        for key in [k for k in _get_cache if k[0].startswith(path)]:
+            del _get_cache[key]
+
+
+@dataclass
+class _ApiResponse:
+    status: int                 # 0 if the request never got a response
+    headers: dict[str, str]     # lowercased header names
+    data: Any                   # decoded JSON body, or None
+    raw: bytes                  # undecoded body (or connection error)
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        """The body as text, for messages — decoded only when asked for."""
+        return self.raw.decode("utf-8", errors="replace")
+
+
+def _send(method: str, url: str, payload: bytes | None, headers: dict) -> _ApiResponse:
+    """Send one request, reconnecting once if the kept-alive connection is stale."""
+    # A kept-alive connection may have been closed by the server while idle;
+    # retry once on a fresh one
+    for attempt in range(2):
+        conn = getattr(_connections, "conn", None)
+        if conn is None:
+            conn = _connections.conn = http.client.HTTPSConnection(_API_HOST, timeout=30)
+        try:
+            conn.request(method, url, body=payload, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+            break
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            _connections.conn = None
+            if attempt:
+                return _ApiResponse(0, {}, None, str(e).encode())
+
+    # json.loads takes the bytes as-is, so a successful response is never
+    # separately decoded to str
+    try:
+        data = json.loads(raw) if raw else None
+    except ValueError:
+        data = None
+    return _ApiResponse(resp.status, {k.lower(): v for k, v in resp.getheaders()}, data, raw)
+
+
+# Transient failures (network errors, rate limiting, gateway errors) are
+# retried with exponential backoff, honouring GitHub's wait hints
+_MAX_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 0.5
+_RETRY_STATUSES = frozenset({0, 429, 502, 503, 504})
+# Never sleep longer than this for a rate-limit reset; fail instead
+_MAX_RETRY_WAIT = 60.0
+
+
+def _retry_delay(result: _ApiResponse, attempt: int) -> float | None:
+    """Seconds to wait before retrying ``result``, or None if it shouldn't be."""
+    headers = result.headers
+    rate_limited = result.status == 429 or (
+        result.status == 403
+        and ("retry-after" in headers or headers.get("x-ratelimit-remaining") == "0")
+    )
+    # Any other 403 is a permissions problem; retrying won't help
+    if not rate_limited and result.status not in _RETRY_STATUSES:
+        return None
+    if "retry-after" in headers:
+        try:
+            delay = float(headers["retry-after"])
+        except ValueError:
+            delay = None
+    elif headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+        delay = max(float(headers["x-ratelimit-reset"]) - time.time(), 0.0) + 1
+    else:
+        delay = None
+    if delay is None:
+        delay = _RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 0.1)
+    return delay if delay <= _MAX_RETRY_WAIT else None
+
+
+def _api(
+    method: str,
+    path: str,
+    params: dict | None = None,
+    body: dict | None = None,
+    verbose: int | None = None,
+) -> _ApiResponse:
+    """Call the GitHub API on this thread's kept-alive HTTPS connection.
 
     Args:
+        params: Query-string parameters.
+        body: JSON request body (POST/PATCH).
         verbose: Verbosity level. If None, falls back to module-level ``verbose``.
     """
-    cmd = ["gh", *args]
-
+    path = path.lstrip("/")
     # Resolve verbosity: explicit parameter wins, else module-level fallback
     _verbose = verbose if verbose is not None else globals()["verbose"]
 
-    if _verbose:
-        print(f"  [gh] running: gh {' '.join(args)}")
+    # Skip the cache at -vv so every request shows up in the debug output
+    use_cache = method == "GET" and _verbose < 2
+    key = (path, tuple(sorted((params or {}).items())))
+    if use_cache:
+        with _get_cache_lock:
+            hit = _get_cache.get(key)
+        if hit and time.monotonic() - hit[0] < _GET_CACHE_TTL:
+            return hit[1]
+    elif method != "GET":
+        _invalidate_cached(path)
+
+    url = "/" + path
+    if params:
+        url += "?" + urlencode(params)
+    headers = {
+        "Authorization": f"Bearer {os.environ.get('GH_TOKEN', '')}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+        "User-Agent": "klaus-kode",
+    }
+    payload = None
+    if body is not None:
+        payload = json.dumps(body).encode()
+        headers["Content-Type"] = "application/json"
+
+    for attempt in range(_MAX_ATTEMPTS):
+        _limiter_for(path).acquire()
+        if _verbose:
+            print(f"  [api] {method} {url}")
+        result = _send(method, url, payload, headers)
+        if _verbose:
+            print(f"  [api] {result.status}: {result.raw[:500].decode('utf-8', errors='replace').strip()}")
+
+        delay = _retry_delay(result, attempt)
+        if delay is None or attempt == _MAX_ATTEMPTS - 1:
+            break
+        if _verbose:
+            print(f"  [api] HTTP {result.status or 'error'} on {method} /{path}, "
+                  f"retrying in {delay:.1f}s", file=sys.stderr)
+        time.sleep(delay)
+
+    if use_cache and result.ok:
+        with _get_cache_lock:
+            _get_cache[key] = (time.monotonic(), result)
+    return result
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
 
-    if _verbose:
-        if result.stdout.strip():
-            print(f"  [gh] stdout: {result.stdout.strip()[:500]}")
-        if result.stderr.strip():
-            print(f"  [gh] stderr: {result.stderr.strip()[:500]}")
+def _graphql(query: str, **variables: Any) -> _ApiResponse:
+    """POST a GraphQL query; partial results still come back in ``data``."""
+    return _api("POST", "graphql", body={"query": query, "variables": variables})
 
-    if check and result.returncode != 0:
-        print(f"Error running gh {' '.join(args)}:", file=sys.stderr)
-        print(result.stderr, file=sys.stderr)
-        raise SystemExit(1)
-    return result
+
+# One round trip answers every capability question: who we are, whether we
+# can list our own repos, and whether we can read a public repo
+_AUTH_PROBE_QUERY = """
+query {
+  viewer { login repositories(first: 1) { totalCount } }
+  repository(owner: "octocat", name: "Hello-World") { id }
+}
+"""
+
+# (authenticated, X-OAuth-Scopes header or None, GraphQL data) — filled once
+# by _auth_probe()
+_auth_probe_result: tuple[bool, str | None, dict] | None = None
+
+
+def _auth_probe() -> tuple[bool, str | None, dict]:
+    """Run the capability query once, returning (ok, OAuth scopes header, data).
+
+    The scopes header is only sent for classic tokens; fine-grained PATs
+    get None. The result is reused by check_gh_auth and check_token_scopes.
+    """
+    global _auth_probe_result
+    if _auth_probe_result is None:
+        if not os.environ.get("GH_TOKEN"):
+            _auth_probe_result = (False, None, {})
+        else:
+            result = _graphql(_AUTH_PROBE_QUERY)
+            # Fields the token can't see come back null next to an "errors" list
+            data = {}
+            if isinstance(result.data, dict):
+                data = result.data.get("data") or {}
+            scopes_header = result.headers.get("x-oauth-scopes")
+            if scopes_header is not None:
+                scopes_header = scopes_header.strip().lower()
+            authenticated = result.ok and bool((data.get("viewer") or {}).get("login"))
+            _auth_probe_result = (authenticated, scopes_header, data)
+    return _auth_probe_result
 
 
 def check_gh_auth() -> bool:
     """Return True if we can authenticate with GitHub."""
-    if not os.environ.get("GH_TOKEN"):
-        return False
-    result = _run_gh("auth", "status", check=False)
-    return result.returncode == 0
+    return _auth_probe()[0]
 
 
 def check_token_scopes() -> dict[str, bool]:
@@ -80,157 +334,366 @@ def check_token_scopes() -> dict[str, bool]:
 
     Returns a dict of scope/capability -> bool.
     """
-    result = _run_gh(
-        "api", "user", "--include", "--jq", ".",
-        check=False,
-    )
+    authenticated, scopes_header, data = _auth_probe()
 
     scopes: dict[str, bool] = {
-        "authenticated": result.returncode == 0,
+        "authenticated": authenticated,
         "can_read_repos": False,
         "can_fork": False,
         "can_create_prs": False,
     }
 
-    if result.returncode != 0:
+    if not authenticated:
         return scopes
 
-    # For fine-grained PATs, check by actually trying key endpoints
-    # Check repo read access
-    read_result = _run_gh("api", "repos/octocat/Hello-World", "--jq", ".id", check=False)
-    scopes["can_read_repos"] = read_result.returncode == 0
+    # Classic tokens list their scopes in a header; "repo" or "public_repo"
+    # cover reading, forking and opening PRs
+    if scopes_header is not None:
+        has_repo = "repo" in scopes_header
+        scopes["can_read_repos"] = True
+        scopes["can_fork"] = has_repo
+        scopes["can_create_prs"] = has_repo
+        return scopes
 
-    # Check if we can list our own repos (implies write access)
-    own_result = _run_gh("api", "user/repos", "--jq", "length", check=False)
-    scopes["can_fork"] = own_result.returncode == 0
+    # For fine-grained PATs, go by which parts of the probe query resolved
+    scopes["can_read_repos"] = bool((data.get("repository") or {}).get("id"))
+
+    # Listing our own repos implies write access
+    scopes["can_fork"] = data["viewer"].get("repositories") is not None
 
     # PR creation uses same permissions as fork + write
     scopes["can_create_prs"] = scopes["can_fork"]
 
-    # Look for X-OAuth-Scopes header in stderr (classic tokens)
-    for line in result.stderr.splitlines():
-        if "X-Oauth-Scopes" in line:
-            scope_str = line.split(":", 1)[-1].strip().lower()
-            if "repo" in scope_str or "public_repo" in scope_str:
-                scopes["can_fork"] = True
-                scopes["can_create_prs"] = True
-            break
-
     return scopes
 
 
+@cache.disk_memoize(_LOOKUP_TTL)
 def validate_repo(repo: str) -> bool:
     """Return True if the repository exists on GitHub."""
-    result = _run_gh("repo", "view", repo, "--json", "name", check=False)
-    return result.returncode == 0
+    return _api("GET", f"repos/{repo}").ok
 
 
+@cache.disk_memoize(_LOOKUP_TTL, _encode_issue, _decode_issue)
 def fetch_issue(repo: str, issue_number: int) -> Issue | None:
     """Fetch issue details from GitHub. Returns None on API failure."""
-    result = _run_gh(
-        "api",
-        f"repos/{repo}/issues/{issue_number}",
-        "--jq", '{"number": .number, "title": .title, "body": .body, "state": .state, "labels": [.labels[].name]}',
-        check=False,
-    )
-    if result.returncode != 0:
+    result = _api("GET", f"repos/{repo}/issues/{issue_number}")
+    if not result.ok:
         print(f"Error: Could not fetch issue #{issue_number} from {repo}.", file=sys.stderr)
-        print(result.stderr.strip(), file=sys.stderr)
+        print(result.text.strip(), file=sys.stderr)
         return None
-    data = json.loads(result.stdout)
+    data = result.data
     return Issue(
         number=data["number"],
         title=data["title"],
-        body=data["body"] or "",
-        labels=data["labels"],
+        body=data.get("body") or "",
+        labels=[label["name"] for label in data.get("labels", [])],
         state=data["state"],
+        # Already in the response, so check_issue_active_work needn't re-fetch
+        assignees=[a["login"] for a in data.get("assignees") or []],
     )
 
 
-def check_issue_active_work(repo: str, issue: Issue) -> tuple[bool, str]:
+# Everything _active_work_reason() needs besides labels
+_ACTIVE_WORK_FRAGMENT = """
+fragment ActiveWork on Issue {
+  assignees(first: 20) { nodes { login } }
+  timelineItems(itemTypes: [CROSS_REFERENCED_EVENT], last: 20) {
+    nodes {
+      ... on CrossReferencedEvent {
+        source {
+          ... on PullRequest { number title state isDraft author { login } }
+        }
+      }
+    }
+  }
+}
+"""
+
+_ISSUE_FULL_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      number
+      title
+      body
+      state
+      labels(first: 50) { nodes { name } }
+      ...ActiveWork
+    }
+  }
+}
+""" + _ACTIVE_WORK_FRAGMENT
+
+
+def _open_linked_prs(node: dict) -> list[dict]:
+    """Extract open PRs that cross-reference the issue from a GraphQL issue node."""
+    linked_prs: list[dict] = []
+    for event in node.get("timelineItems", {}).get("nodes", []):
+        source = (event or {}).get("source") or {}
+        if source.get("state") == "OPEN":
+            linked_prs.append({
+                "number": source["number"],
+                "title": source.get("title", ""),
+                "isDraft": source.get("isDraft", False),
+                "author": source.get("author") or {},
+            })
+    return linked_prs
+
+
+def _issue_from_graphql(node: dict) -> Issue:
+    """Build an Issue (including assignees and open linked PRs) from a GraphQL issue node."""
+    return Issue(
+        number=node["number"],
+        title=node["title"],
+        body=node.get("body") or "",
+        labels=[label["name"] for label in node.get("labels", {}).get("nodes", [])],
+        state=node["state"].lower(),
+        assignees=[a["login"] for a in node.get("assignees", {}).get("nodes", [])],
+        linked_prs=_open_linked_prs(node),
+    )
+
+
+@cache.disk_memoize(_LOOKUP_TTL, _encode_issue, _decode_issue)
+def fetch_issue_full(repo: str, issue_number: int) -> Issue | None:
+    """Fetch an issue plus its assignees and linked PRs in one GraphQL request.
+
+    The returned Issue carries everything check_issue_active_work needs, so
+    checking it costs no further API calls. Returns None on API failure.
+    """
+    owner, name = repo.split("/", 1)
+    result = _graphql(_ISSUE_FULL_QUERY, owner=owner, name=name, number=issue_number)
+    node = None
+    if result.ok and isinstance(result.data, dict):
+        node = ((result.data.get("data") or {}).get("repository") or {}).get("issue")
+    if node is None:
+        print(f"Error: Could not fetch issue #{issue_number} from {repo}.", file=sys.stderr)
+        print(result.text.strip(), file=sys.stderr)
+        return None
+    return _issue_from_graphql(node)
+
+
+def _fetch_assignees(repo: str, number: int) -> list[str]:
+    result = _api("GET", f"repos/{repo}/issues/{number}")
+    if not result.ok:
+        return []
+    return [a["login"] for a in result.data.get("assignees") or []]
+
+
+def _search_linked_prs(repo: str, number: int) -> list[dict]:
+    result = _api("GET", "search/issues", {"q": f"repo:{repo} is:pr is:open #{number}"})
+    if not result.ok:
+        return []
+    return [
+        {
+            "number": item["number"],
+            "title": item["title"],
+            "isDraft": item.get("draft", False),
+            "author": {"login": (item.get("user") or {}).get("login", "unknown")},
+        }
+        for item in result.data.get("items", [])
+    ]
+
+
+def check_issue_active_work(
+    repo: str, issue: Issue, executor: Executor | None = None,
+) -> tuple[bool, str]:
     """Check if an issue is already being actively worked on.
 
     Returns (is_active, reason). If is_active is True, the caller should
-    skip this issue to avoid duplicating effort.
+    skip this issue to avoid duplicating effort. Issues returned by
+    fetch_issue_full() are checked without any API calls; otherwise the
+    two lookups run concurrently when an ``executor`` is given. Don't pass
+    the executor this call itself runs on: it would wait on its own pool.
     """
+    prs_future = None
+    if issue.linked_prs is None and executor is not None:
+        prs_future = executor.submit(_search_linked_prs, repo, issue.number)
+
+    assignees = issue.assignees
+    if assignees is None:
+        assignees = _fetch_assignees(repo, issue.number)
+
+    if prs_future is not None:
+        linked_prs = prs_future.result()
+    elif issue.linked_prs is None:
+        linked_prs = _search_linked_prs(repo, issue.number)
+    else:
+        linked_prs = issue.linked_prs
+
+    return _active_work_reason(issue, assignees, linked_prs)
+
+
+def bulk_active_work(repo: str, issues: list[Issue]) -> None:
+    """Fill in assignees and linked PRs for many issues with one GraphQL request.
+
+    Issues are updated in place, so a following check_issue_active_work()
+    costs no API calls. Issues the response doesn't cover (or all of them,
+    if the request fails) are left untouched and fall back to REST there.
+    """
+    pending = [issue for issue in issues if issue.assignees is None or issue.linked_prs is None]
+    if not pending:
+        return
+    owner, name = repo.split("/", 1)
+    aliases = "\n".join(
+        f"    i{issue.number}: issue(number: {issue.number}) {{ ...ActiveWork }}"
+        for issue in pending
+    )
+    query = (
+        "query($owner: String!, $name: String!) {\n"
+        "  repository(owner: $owner, name: $name) {\n"
+        f"{aliases}\n"
+        "  }\n"
+        "}\n"
+    ) + _ACTIVE_WORK_FRAGMENT
+    result = _graphql(query, owner=owner, name=name)
+    if not isinstance(result.data, dict):
+        return
+    # Issues that errored (e.g. deleted) come back as null alongside the rest
+    nodes = (result.data.get("data") or {}).get("repository") or {}
+    for issue in pending:
+        node = nodes.get(f"i{issue.number}")
+        if node is None:
+            continue
+        issue.assignees = [a["login"] for a in node.get("assignees", {}).get("nodes", [])]
+        issue.linked_prs = _open_linked_prs(node)
+
+
+# Labels that mark an issue as claimed (compared lowercase)
+_WIP_LABELS: frozenset[str] = frozenset({
+    "in progress", "in-progress", "wip", "work in progress",
+    "work-in-progress", "claimed", "assigned",
+})
+
+
+def _active_work_reason(issue: Issue, assignees: list[str], linked_prs: list[dict]) -> tuple[bool, str]:
+    """Decide whether an issue is taken, given its assignees and open linked PRs."""
     reasons: list[str] = []
 
     # 1. Check assignees
-    result = _run_gh(
-        "api",
-        f"repos/{repo}/issues/{issue.number}",
-        "--jq", "[.assignees[].login]",
-        check=False,
-    )
-    if result.returncode == 0:
-        assignees = json.loads(result.stdout)
-        if assignees:
-            reasons.append(f"assigned to: {', '.join(assignees)}")
+    if assignees:
+        reasons.append(f"assigned to: {', '.join(assignees)}")
 
     # 2. Check for work-in-progress labels
-    wip_labels = {
-        "in progress", "in-progress", "wip", "work in progress",
-        "work-in-progress", "claimed", "assigned",
-    }
-    for label in issue.labels:
-        if label.lower() in wip_labels:
-            reasons.append(f"has label: '{label}'")
+    reasons += [f"has label: '{label}'" for label in issue.labels if label.lower() in _WIP_LABELS]
 
     # 3. Check for open/draft PRs that reference this issue
-    result = _run_gh(
-        "pr", "list",
-        "--repo", repo,
-        "--state", "open",
-        "--search", f"#{issue.number}",
-        "--json", "number,title,author,isDraft",
-        check=False,
-    )
-    if result.returncode == 0 and result.stdout.strip():
-        prs = json.loads(result.stdout)
-        for pr in prs:
-            kind = "Draft PR" if pr.get("isDraft") else "PR"
-            author = pr.get("author", {}).get("login", "unknown")
-            reasons.append(
-                f"{kind} #{pr['number']} by {author}: {pr['title']}"
-            )
+    for pr in linked_prs:
+        kind = "Draft PR" if pr.get("isDraft") else "PR"
+        author = pr.get("author", {}).get("login", "unknown")
+        reasons.append(
+            f"{kind} #{pr['number']} by {author}: {pr['title']}"
+        )
 
     if reasons:
         return True, "Issue is already being worked on:\n  - " + "\n  - ".join(reasons)
     return False, ""
 
 
+# Labels that indicate non-coding issues (compared lowercase)
+NON_CODING_LABELS: frozenset[str] = frozenset({
+    "question", "discussion", "support",
+    "wontfix", "won't fix", "duplicate", "invalid",
+    "needs info", "needs-info", "needs more info",
+    "waiting for response", "waiting-for-response",
+})
+
+# GitHub rejects search queries longer than this
+_MAX_SEARCH_QUERY = 256
+
+
+def _issue_search_query(repo: str) -> tuple[str, frozenset[str]]:
+    """Build the open-issue search query for a repo.
+
+    Excludes as many NON_CODING_LABELS as fit in the query length limit and
+    returns them alongside the query; the rest must be filtered client-side.
+    """
+    query = f"repo:{repo} is:issue is:open"
+    excluded: set[str] = set()
+    for label in sorted(NON_CODING_LABELS, key=lambda label: (len(label), label)):
+        term = f'-label:"{label}"' if " " in label else f"-label:{label}"
+        if len(query) + 1 + len(term) > _MAX_SEARCH_QUERY:
+            break
+        query += " " + term
+        excluded.add(label)
+    return query, frozenset(excluded)
+
+
+_ISSUE_LIST_QUERY = """
+query($owner: String!, $name: String!, $limit: Int!) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $limit, states: OPEN, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        number
+        title
+        body
+        state
+        labels(first: 20) { nodes { name } }
+        ...ActiveWork
+      }
+    }
+  }
+}
+""" + _ACTIVE_WORK_FRAGMENT
+
+
+def _is_coding_issue(labels: list[str], non_coding: frozenset[str] = NON_CODING_LABELS) -> bool:
+    return not any(label.lower() in non_coding for label in labels)
+
+
+@cache.disk_memoize(_LOOKUP_TTL, _encode_issues, _decode_issues)
 def search_issues(repo: str, limit: int = 30) -> list[Issue]:
-    """Fetch a batch of open issues from the repo.
+    """Fetch a batch of open issues from the repo, minus non-coding ones.
 
-    Filters out pull requests (GitHub API returns PRs mixed in).
-    Returns a list of Issue objects sorted by most recently updated.
+    One GraphQL request returns the issues together with their assignees and
+    open linked PRs, so check_issue_active_work() needs no further calls.
+    Returns a list of Issue objects sorted by most recently updated. Falls
+    back to the REST search API if the GraphQL request fails.
     """
-    result = _run_gh(
-        "api",
-        f"repos/{repo}/issues?state=open&per_page={limit}&sort=updated",
-        check=False,
-    )
-    if result.returncode != 0:
+    owner, name = repo.split("/", 1)
+    result = _graphql(_ISSUE_LIST_QUERY, owner=owner, name=name, limit=limit)
+    if result.ok and isinstance(result.data, dict) and not result.data.get("errors"):
+        repository = (result.data.get("data") or {}).get("repository")
+        if repository is not None:
+            issues = (_issue_from_graphql(node) for node in repository["issues"]["nodes"])
+            return [issue for issue in issues if _is_coding_issue(issue.labels)]
+    return _search_issues_rest(repo, limit)
+
+
+def _search_issues_rest(repo: str, limit: int) -> list[Issue]:
+    """search_issues() via the search API, without active-work details.
+
+    GitHub drops pull requests and most NON_CODING_LABELS server-side;
+    labels that didn't fit in the query are filtered here.
+    """
+    query, excluded = _issue_search_query(repo)
+    result = _api("GET", "search/issues", {"q": query, "sort": "updated", "per_page": limit})
+    if not result.ok:
         print(f"Error: Could not fetch issues from {repo}.", file=sys.stderr)
-        print(result.stderr.strip(), file=sys.stderr)
+        print(result.text.strip(), file=sys.stderr)
         return []
 
-    items = json.loads(result.stdout)
+    remaining = NON_CODING_LABELS - excluded
     issues: list[Issue] = []
-    for item in items:
-        # GitHub API returns PRs mixed in with issues — filter them out
-        if "pull_request" in item:
+    for item in result.data.get("items", []):
+        labels = [label["name"] for label in item.get("labels", [])]
+        if not _is_coding_issue(labels, remaining):
             continue
         issues.append(Issue(
             number=item["number"],
             title=item["title"],
             body=item.get("body") or "",
-            labels=[label["name"] for label in item.get("labels", [])],
+            labels=labels,
             state=item["state"],
         ))
     return issues
 
 
+# Words that describe "a repo" rather than what the repo is about
+_NOISE_WORD_RE = re.compile(r"repos?|repositor(?:y|ies)|projects?|librar(?:y|ies)", re.IGNORECASE)
+_SPLIT_RE = re.compile(r"[\s/]+")
+
+
+@cache.disk_memoize(_LOOKUP_TTL, _encode_list, _decode_repos)
 def search_repos(description: str, limit: int = 10) -> list[Repository]:
     """Search GitHub for repositories matching a description.
 
@@ -238,24 +701,19 @@ def search_repos(description: str, limit: int = 10) -> list[Repository]:
     meaningful search terms. Filters for repos with >10 stars.
     Returns a list of Repository objects sorted by stars.
     """
-    # Strip words that describe "a repo" rather than what the repo is about
-    noise_words = {"repo", "repos", "repository", "repositories", "project", "projects", "library", "libraries"}
-    words = re.split(r'[\s/]+', description)
-    cleaned = " ".join(w for w in words if w.lower() not in noise_words)
+    words = _SPLIT_RE.split(description)
+    cleaned = " ".join(w for w in words if not _NOISE_WORD_RE.fullmatch(w))
     if not cleaned.strip():
         cleaned = description  # fallback to original if everything was stripped
-    query = quote(f"{cleaned} stars:>10", safe="")
-    result = _run_gh(
-        "api",
-        f"search/repositories?q={query}&sort=stars&order=desc&per_page={limit}",
-        check=False,
-    )
-    if result.returncode != 0:
+    result = _api("GET", "search/repositories", {
+        "q": f"{cleaned} stars:>10", "sort": "stars", "order": "desc", "per_page": limit,
+    })
+    if not result.ok:
         print("Error: Could not search repositories.", file=sys.stderr)
-        print(result.stderr.strip(), file=sys.stderr)
+        print(result.text.strip(), file=sys.stderr)
         return []
 
-    data = json.loads(result.stdout)
+    data = result.data
     repos: list[Repository] = []
     for item in data.get("items", []):
         repos.append(Repository(
@@ -271,30 +729,37 @@ def search_repos(description: str, limit: int = 10) -> list[Repository]:
 
 def fork_repo(repo: str) -> str:
     """Fork the repo to the authenticated user's account. Returns fork 'owner/name'."""
-    # --clone=false: don't clone locally, we clone separately
-    result = _run_gh("repo", "fork", repo, "--clone=false", check=False)
-    if result.returncode != 0:
-        print(f"  Fork command failed (exit {result.returncode}):", file=sys.stderr)
-        print(f"    {result.stderr.strip()}", file=sys.stderr)
-        if "403" in result.stderr or "not accessible" in result.stderr:
+    result = _api("POST", f"repos/{repo}/forks")
+    if not result.ok:
+        print(f"  Fork request failed (HTTP {result.status}):", file=sys.stderr)
+        print(f"    {result.text.strip()}", file=sys.stderr)
+        if result.status == 403 or "not accessible" in result.text:
             print("\n  Your token is missing fork/repo permissions.", file=sys.stderr)
             print("  For fine-grained PATs: enable 'Contents: Read and write' permission.", file=sys.stderr)
             print("  For classic tokens: enable the 'public_repo' scope.", file=sys.stderr)
             print("  Create a new token at: https://github.com/settings/tokens", file=sys.stderr)
             raise SystemExit(1)
-
-    # Get the authenticated user's login to build the fork name.
-    user_result = _run_gh("api", "user", "--jq", ".login")
-    username = user_result.stdout.strip()
-    repo_name = repo.split("/")[-1]
-    fork_full = f"{username}/{repo_name}"
-
-    # Wait for the fork to be available (GitHub can take a few seconds)
-    for attempt in range(6):
+        # Forking an existing fork again fails; fall back to the expected name
+        login = (_api("GET", "user").data or {}).get("login", "")
+        fork_full = f"{login}/{repo.split('/')[-1]}"
+    else:
+        # The response names the fork even if it already existed
+        fork_full = result.data["full_name"]
+
+    # Wait for the fork to be available. It is usually ready within a second,
+    # but GitHub can take a while, so back off up to ~30s in total.
+    delay = 0.25
+    waited = 0.0
+    while True:
         if validate_repo(fork_full):
             return fork_full
-        print(f"  Waiting for fork to be available... (attempt {attempt + 1}/6)")
-        time.sleep(5)
+        if waited >= 30:
+            break
+        if delay >= 1:
+            print(f"  Waiting for fork to be available... ({waited:.0f}s)")
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, 5.0)
 
     print(f"Error: Fork {fork_full} not found after forking.", file=sys.stderr)
     raise SystemExit(1)
@@ -2,36 +2,34 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
-import subprocess
 from typing import TYPE_CHECKING
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
-from klaus_kode.claude_sdk import _quick_claude, run_claude_streaming
+from klaus_kode.claude_sdk import _quick_claude, run_claude_streaming, run_sync
 from klaus_kode.github import Issue
 from klaus_kode.prompts import REVIEWER_SYSTEM_PROMPT, REVIEW_TOOLS
-from klaus_kode.repo_ops import REPO_PATH
+from klaus_kode.repo_ops import capture_diff, compact_diff
 
 if TYPE_CHECKING:
     from klaus_kode.run_logger import RunLogger
 
 
-def show_changes(default_branch: str) -> None:
-    """Show the git diff of changes made."""
+def show_changes(default_branch: str, diff_output: str = "") -> str:
+    """Show the git diff of changes made, returning the (capped) diff text.
+
+    Prints ``diff_output`` when given; otherwise streams git's output while
+    capturing it, so the diff is only generated once either way. Either
+    way it opens with a --stat summary of the files changed.
+    """
     print()
     print("[8/9] Showing changes made...")
-    print("  Files changed:")
-    subprocess.run(
-        ["git", "--no-pager", "diff", "--stat", f"upstream/{default_branch}"],
-        cwd=REPO_PATH,
-    )
-    print()
-    subprocess.run(
-        ["git", "--no-pager", "diff", f"upstream/{default_branch}"],
-        cwd=REPO_PATH,
-    )
+    if diff_output:
+        print(diff_output)
+    else:
+        diff_output = capture_diff(default_branch, echo=True)
     print()
+    return diff_output
 
 
 def run_claude_review(
@@ -63,7 +61,8 @@ def run_claude_review(
         start_time_global=start_time_global,
     )
 
-    if output.strip() and output.strip().split('\n')[-1].strip().startswith("REJECTED"):
+    # The verdict is on the last line
+    if output.rstrip().rpartition("\n")[2].lstrip().startswith("REJECTED"):
         print()
         print("=== SELF-REVIEW REJECTED ===")
         raise SystemExit(1)
@@ -72,24 +71,38 @@ def run_claude_review(
     print("=== SELF-REVIEW APPROVED ===")
 
 
+# Diff bytes included in the PR description prompt
+_PR_DIFF_BUDGET = 16_000
+
+
+def description_diff(default_branch: str, diff_output: str = "") -> str:
+    """The diff to describe: ``diff_output`` if it fits the prompt budget.
+
+    Otherwise it is rebuilt from whole files rather than cut mid-hunk,
+    which reads the repo, so call this before anything else edits it.
+    """
+    if not diff_output or len(diff_output.encode()) > _PR_DIFF_BUDGET:
+        return compact_diff(default_branch, max_bytes=_PR_DIFF_BUDGET)
+    return diff_output
+
+
 def generate_pr_description(issue: Issue, repo: str, default_branch: str,
                             diff_output: str = "") -> tuple[str, str]:
     """Ask Claude to generate a PR title and body for the changes made.
 
+    ``diff_output`` is used as given, so callers running this alongside
+    other work should settle it first with description_diff(). Without
+    one, the diff is read here.
+
     Returns (title, body). Falls back to pr_template if Claude fails.
     """
     if not diff_output:
-        # Capture diff if not provided
-        result = subprocess.run(
-            ["git", "--no-pager", "diff", f"upstream/{default_branch}"],
-            capture_output=True, text=True, cwd=REPO_PATH,
-        )
-        diff_output = result.stdout[:20000]
+        diff_output = description_diff(default_branch)
 
     prompt = (
         f"Write a GitHub PR title and body for the changes shown below. "
         f"The PR addresses issue #{issue.number}: {issue.title}.\n\n"
-        f"```diff\n{diff_output[:20000]}\n```\n\n"
+        f"```diff\n{diff_output}\n```\n\n"
         f"Return JSON with 'title' (string) and 'body' (markdown string)."
     )
 
@@ -107,7 +120,7 @@ def generate_pr_description(issue: Issue, repo: str, default_branch: str,
     }
 
     try:
-        raw = asyncio.run(_quick_claude(prompt, output_format=output_format))
+        raw = run_sync(_quick_claude(prompt, output_format=output_format))
         if raw.strip():
             data = json.loads(raw)
             title = data.get("title", "").strip()
@@ -122,6 +135,10 @@ def generate_pr_description(issue: Issue, repo: str, default_branch: str,
     return format_pr_title(issue), format_pr_body(issue, repo=repo)
 
 
+# Browsers and GitHub start rejecting URLs past roughly this length
+_MAX_URL_LENGTH = 8000
+
+
 def _build_compare_url(
     title: str,
     body: str,
@@ -131,23 +148,19 @@ def _build_compare_url(
     pr_file: str,
 ) -> tuple[str, str]:
     """Build a GitHub compare URL as fallback. Returns (url, body_note)."""
-    params = {
-        "quick_pull": "1",
-        "title": title,
-        "body": body,
-    }
-    query_str = "&".join(f"{k}={quote(v)}" for k, v in params.items())
-    url = f"https://github.com/{repo}/compare/{default_branch}...{head}?{query_str}"
-
-    if len(url) > 8000:
-        params.pop("body")
-        query_str = "&".join(f"{k}={quote(v)}" for k, v in params.items())
-        url = f"https://github.com/{repo}/compare/{default_branch}...{head}?{query_str}"
-        body_note = f"  (PR body too long for URL \u2014 paste from {pr_file})"
-    else:
-        body_note = ""
+    url = (
+        f"https://github.com/{repo}/compare/{default_branch}...{head}?"
+        + urlencode({"quick_pull": "1", "title": title}, quote_via=quote)
+    )
 
-    return url, body_note
+    # Percent-encoding never shortens the body, so skip quoting (a possibly
+    # large) one that can't fit anyway
+    room = _MAX_URL_LENGTH - len(url) - len("&body=")
+    if len(body) <= room:
+        body_q = quote(body)
+        if len(body_q) <= room:
+            return url + "&body=" + body_q, ""
+    return url, f"  (PR body too long for URL \u2014 paste from {pr_file})"
 
 
 def save_pr_description(
@@ -24,6 +24,7 @@ Rules:
 - If the project has a formatter or linter (e.g. `make style`, `black`, `ruff`), run it.
 - Run any existing tests related to your changes to make sure nothing breaks.
 - Make clean, focused commits with descriptive messages.
+- Never add Co-Authored-By trailers to commit messages.
 
 Efficiency (critical \u2014 follow these exactly):
 - A repository context snapshot is provided in the prompt. Use it instead of exploring.
@@ -68,29 +69,31 @@ DISALLOWED_TOOLS = ["TodoWrite", "Task", "WebSearch", "WebFetch"]
 
 def build_work_prompt(issue: Issue, repo: str, guidelines: str,
                       repo_context: str = "") -> str:
-    """Build the task prompt for Claude to work on the issue."""
-    prompt = f"Fix issue #{issue.number} in {repo}.\n\n"
-    prompt += f"**Title:** {issue.title}\n**Body:**\n{issue.body}\n"
+    """Build the task prompt for Claude to work on the issue.
+
+    Repo-level sections come before the issue, so runs against the same repo
+    share the longest possible prompt prefix for caching.
+    """
+    prompt = f"You are working in {repo}.\n"
     if guidelines:
         prompt += f"\n**Contributing guidelines:**\n{guidelines}\n"
     if repo_context:
         prompt += f"\n**Repository context (pre-fetched \u2014 do NOT re-explore):**\n{repo_context}\n"
+    prompt += f"\nFix issue #{issue.number} in {repo}.\n\n"
+    prompt += f"**Title:** {issue.title}\n**Body:**\n{issue.body}\n"
     return prompt
 
 
 def build_review_prompt(default_branch: str, diff_output: str = "") -> str:
-    """Build the task prompt for Claude to self-review changes."""
-    prompt = "Review the changes made to fix the issue.\n\n"
-
-    if diff_output:
-        prompt += f"Here is the complete diff:\n```\n{diff_output}\n```\n\n"
-    else:
-        prompt += (
-            f"Run `git diff upstream/{default_branch}` to see the changes "
-            f"against the base branch.\n\n"
-        )
-
-    prompt += (
+    """Build the task prompt for Claude to self-review changes.
+
+    The fixed checklist comes first and the diff after it, for the same
+    prefix-caching reason as build_work_prompt. A one-line verdict reminder
+    follows the diff, since pr_description reads the verdict from the last
+    line of the reply.
+    """
+    prompt = (
+        "Review the changes made to fix the issue.\n\n"
         "Check for:\n"
         "- Correctness: Does the implementation actually address the issue?\n"
         "- Test coverage: Are there tests for the new behavior?\n"
@@ -101,6 +104,15 @@ def build_review_prompt(default_branch: str, diff_output: str = "") -> str:
         "Do NOT re-read files that are shown in the diff.\n\n"
         "After your review, output exactly one of:\n"
         "- APPROVED \u2014 if the changes are ready for a PR.\n"
-        "- REJECTED: <reason> \u2014 if the changes have unfixable problems."
+        "- REJECTED: <reason> \u2014 if the changes have unfixable problems.\n\n"
     )
+
+    if diff_output:
+        prompt += f"Here is the complete diff:\n```\n{diff_output}\n```\n"
+    else:
+        prompt += (
+            f"Run `git diff upstream/{default_branch}` to see the changes "
+            f"against the base branch.\n"
+        )
+    prompt += "\nEnd your reply with the verdict alone on the last line: APPROVED or REJECTED: <reason>.\n"
     return prompt
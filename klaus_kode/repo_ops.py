@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
+import shutil
 import subprocess
+import sys
 from typing import TYPE_CHECKING
 
+from klaus_kode import cache
 from klaus_kode.github import Issue
 
 if TYPE_CHECKING:
@@ -15,92 +20,179 @@ if TYPE_CHECKING:
 REPO_PATH = "/workspace/repo"
 
 
-def clone_repo(repo: str, fork_repo: str, logger: RunLogger | None = None) -> str:
-    """Configure git, clone the fork, set up upstream, detect default branch.
-
-    Returns the default branch name (e.g. 'main' or 'master').
-    """
+def _make_runner(logger: RunLogger | None):
+    """Return a subprocess.run wrapper that logs each call when a logger is given."""
     def _run(cmd, **kwargs):
-        """Run a subprocess and optionally log it."""
         r = subprocess.run(cmd, **kwargs)
         if logger:
-            stdout = ""
-            stderr = ""
+            stdout = stderr = ""
             if kwargs.get("capture_output"):
-                stdout = r.stdout if isinstance(r.stdout, str) else (r.stdout or b"").decode("utf-8", errors="replace")
-                stderr = r.stderr if isinstance(r.stderr, str) else (r.stderr or b"").decode("utf-8", errors="replace")
+                # Passed through undecoded; the logger caps them first
+                stdout, stderr = r.stdout or "", r.stderr or ""
             logger.log_subprocess(cmd, r.returncode, stdout, stderr)
         return r
+    return _run
+
+
+def _mirror_path(repo: str) -> str | None:
+    """Persistent clone of ``repo`` reused across runs, or None if disabled.
+
+    Opt-in: only used with KLAUS_KODE_CLONE_CACHE=1.
+    """
+    if os.environ.get("KLAUS_KODE_CLONE_CACHE") != "1":
+        return None
+    return cache.cache_path(os.path.join("repos", repo.replace("/", "__")))
+
+
+# Settings every git command in the run needs, including the ones Claude runs
+_GIT_CONFIG = {
+    "user.name": "klaus-kode",
+    "user.email": "klaus-kode@users.noreply.github.com",
+    "core.pager": "cat",
+    # Cheaper have/want negotiation when fetching into a long history
+    "fetch.negotiationAlgorithm": "skipping",
+}
+
+
+def _configure_git(logger: RunLogger | None = None) -> None:
+    """Apply _GIT_CONFIG to this process and every git it spawns.
+
+    Uses git's GIT_CONFIG_COUNT/KEY/VALUE environment variables rather than
+    one `git config --global` process per key, which also leaves the
+    user's ~/.gitconfig alone. Keys already set this way are overwritten
+    in place, so calling it again doesn't add entries.
+    """
+    count = int(os.environ.get("GIT_CONFIG_COUNT", "0") or 0)
+    slots = {os.environ.get(f"GIT_CONFIG_KEY_{i}"): i for i in range(count)}
+    for key, value in _GIT_CONFIG.items():
+        i = slots.get(key)
+        if i is None:
+            i = slots[key] = count
+            count += 1
+        os.environ[f"GIT_CONFIG_KEY_{i}"] = key
+        os.environ[f"GIT_CONFIG_VALUE_{i}"] = value
+    os.environ["GIT_CONFIG_COUNT"] = str(count)
+    if logger:
+        logger.log_decision(
+            decision="git_configured",
+            reason="git settings applied through GIT_CONFIG_* environment variables",
+            config=_GIT_CONFIG,
+        )
+
+
+def _head_commit(repo_path: str) -> str | None:
+    """Commit checked out in ``repo_path``, resolved from .git without running git."""
+    git_dir = os.path.join(repo_path, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            return head  # detached
+        ref = head[len("ref: "):]
+        try:
+            with open(os.path.join(git_dir, ref)) as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            with open(os.path.join(git_dir, "packed-refs")) as f:
+                for line in f:
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha
+    except OSError:
+        pass
+    return None
+
+
+def _head_branch(repo_path: str) -> str | None:
+    """Branch checked out in ``repo_path``, read from .git/HEAD without running git."""
+    try:
+        with open(os.path.join(repo_path, ".git", "HEAD")) as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    prefix = "ref: refs/heads/"
+    return head[len(prefix):] if head.startswith(prefix) else None
+
+
+def clone_upstream(repo: str, logger: RunLogger | None = None) -> str:
+    """Configure git and partially clone the upstream repo as remote 'upstream'.
+
+    Needs no fork, so it can run while the fork is still being created.
+    Returns the default branch name (e.g. 'main' or 'master').
+    """
+    _run = _make_runner(logger)
 
     print("[1/9] Configuring git...")
-    _run(["git", "config", "--global", "user.name", "klaus-kode"], check=True)
-    _run(
-        ["git", "config", "--global", "user.email", "klaus-kode@users.noreply.github.com"],
-        check=True,
-    )
-    _run(["git", "config", "--global", "core.pager", "cat"], check=True)
+    _configure_git(logger)
 
     print("[2/9] Setting up GitHub authentication...")
     _run(["gh", "auth", "setup-git"], check=True, capture_output=True)
 
-    print(f"[3/9] Cloning fork {fork_repo} (shallow)...")
-    _run(
-        ["git", "clone", "--depth=1", "--single-branch",
-         f"https://github.com/{fork_repo}.git", REPO_PATH],
-        check=True,
-    )
+    # Full history of the default branch but only the blobs that get read
+    # (checked out, diffed, ...): no tags, other blobs fetched on demand
+    clone_cmd = [
+        "git", "clone", "--filter=blob:none", "--single-branch", "--no-tags", "--origin", "upstream",
+        f"https://github.com/{repo}.git",
+    ]
+    mirror = _mirror_path(repo)
+    if mirror is not None:
+        # Clones cached before partial cloning were shallow; start those over
+        if os.path.exists(os.path.join(mirror, ".git", "shallow")):
+            shutil.rmtree(mirror, ignore_errors=True)
+        # Refresh the cached clone; start it over if it can't be updated
+        if os.path.isdir(os.path.join(mirror, ".git")):
+            print(f"[3/9] Updating cached clone of {repo}...")
+            updated = _run(
+                ["git", "-C", mirror, "fetch", "--no-tags", "upstream"],
+                capture_output=True,
+            )
+            if updated.returncode == 0:
+                updated = _run(
+                    ["git", "-C", mirror, "reset", "--hard", "@{upstream}"],
+                    capture_output=True,
+                )
+            if updated.returncode != 0:
+                shutil.rmtree(mirror, ignore_errors=True)
+        if not os.path.isdir(os.path.join(mirror, ".git")):
+            print(f"[3/9] Cloning {repo} (partial, cached for later runs)...")
+            try:
+                os.makedirs(os.path.dirname(mirror), exist_ok=True)
+            except OSError:
+                mirror = None
+            else:
+                _run(clone_cmd + [mirror], check=True)
+
+    if mirror is None:
+        print(f"[3/9] Cloning {repo} (partial)...")
+        _run(clone_cmd + [REPO_PATH], check=True)
+    else:
+        # Copy-on-write where the filesystem supports it, plain copy otherwise
+        os.makedirs(REPO_PATH, exist_ok=True)
+        _run(["cp", "-a", "--reflink=auto", f"{mirror}/.", REPO_PATH], check=True)
+
+    # The clone checks out upstream's default branch, so it's named in HEAD
+    default_branch = _head_branch(REPO_PATH) or "main"
+    print(f"  Default branch: {default_branch}")
+    return default_branch
 
-    # Set up upstream remote
-    result = _run(
-        ["git", "remote", "set-url", "upstream", f"https://github.com/{repo}.git"],
-        capture_output=True,
-        cwd=REPO_PATH,
-    )
-    if result.returncode != 0:
-        _run(
-            ["git", "remote", "add", "upstream", f"https://github.com/{repo}.git"],
-            check=True,
-            cwd=REPO_PATH,
-        )
-    _run(
-        ["git", "fetch", "upstream", "main", "--depth=1"],
-        capture_output=True,
-        cwd=REPO_PATH,
-    )
-    # Also try fetching master in case that's the default
+
+def attach_fork(fork_repo: str, logger: RunLogger | None = None) -> None:
+    """Add the fork as remote 'origin', where the work branch gets pushed."""
+    _run = _make_runner(logger)
     _run(
-        ["git", "fetch", "upstream", "master", "--depth=1"],
-        capture_output=True,
+        ["git", "remote", "add", "origin", f"https://github.com/{fork_repo}.git"],
+        check=True,
         cwd=REPO_PATH,
     )
 
-    # Detect default branch
-    default_branch = "main"
-    check_main = _run(
-        ["git", "rev-parse", "--verify", "upstream/main"],
-        capture_output=True,
-        cwd=REPO_PATH,
-    )
-    if check_main.returncode != 0:
-        check_master = _run(
-            ["git", "rev-parse", "--verify", "upstream/master"],
-            capture_output=True,
-            cwd=REPO_PATH,
-        )
-        if check_master.returncode == 0:
-            default_branch = "master"
-        else:
-            # Fallback: first remote branch from upstream
-            result = _run(
-                ["git", "branch", "-r"], capture_output=True, text=True, cwd=REPO_PATH,
-            )
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if line.startswith("upstream/"):
-                    default_branch = line.split("upstream/", 1)[1]
-                    break
 
-    print(f"  Default branch: {default_branch}")
+def clone_repo(repo: str, fork_repo: str, logger: RunLogger | None = None) -> str:
+    """Clone upstream and attach the fork as 'origin'.
+
+    Returns the default branch name (e.g. 'main' or 'master').
+    """
+    default_branch = clone_upstream(repo, logger=logger)
+    attach_fork(fork_repo, logger=logger)
     return default_branch
 
 
@@ -108,33 +200,74 @@ def create_branch(branch_name: str, default_branch: str) -> None:
     """Create and check out a new feature branch based on upstream default branch."""
     print(f"[5/9] Creating branch {branch_name}...")
     subprocess.run(
-        ["git", "checkout", "-b", branch_name, f"upstream/{default_branch}"],
+        ["git", "checkout", "-b", branch_name, "--track", f"upstream/{default_branch}"],
         check=True,
         cwd=REPO_PATH,
     )
     print(f"  Base branch: {default_branch}")
 
 
+def _existing_files(repo_path: str, candidates: list[str]) -> list[str]:
+    """The ``candidates`` (paths relative to ``repo_path``) that are files, in order.
+
+    Each directory involved is listed once rather than stat-ing every
+    candidate, most of which don't exist.
+    """
+    listings: dict[str, set[str]] = {}
+    found = []
+    for rel in candidates:
+        parent, name = os.path.split(rel)
+        if parent not in listings:
+            try:
+                with os.scandir(os.path.join(repo_path, parent)) as it:
+                    listings[parent] = {e.name for e in it if e.is_file()}
+            except OSError:
+                listings[parent] = set()
+        if name in listings[parent]:
+            found.append(rel)
+    return found
+
+
+# Caps on how much of each file goes into the prompt. Characters rather than
+# lines, so a file of very long lines can't blow up the prompt.
+_GUIDELINES_MAX_CHARS = 8_000
+_README_MAX_CHARS = 6_000
+
+
+def _read_head(path: str, limit: int) -> str:
+    """Up to ``limit`` characters of ``path``, cut back to the last whole line."""
+    with open(path, errors="replace") as f:
+        text = f.read(limit + 1)
+    if len(text) > limit:
+        text = text[:limit]
+        cut = text.rfind("\n")
+        if cut != -1:
+            text = text[:cut + 1]
+    return text
+
+
 def read_contributing_guidelines() -> str:
     """Find and read contributing guideline files. Returns concatenated content or empty string."""
     print("[4/9] Reading contributing guidelines...")
+    head = _head_commit(REPO_PATH)
+    if head is None:
+        return _read_contributing_guidelines.__wrapped__(REPO_PATH, head)
+    return _read_contributing_guidelines(REPO_PATH, head)
+
+
+# Until Claude starts editing, the repo's files only change when its HEAD
+# does, so both readers are memoized on the commit (when it can be resolved)
+@functools.lru_cache(maxsize=4)
+def _read_contributing_guidelines(repo_path: str, head: str | None) -> str:
     guideline_files = [
         "CONTRIBUTING.md", "CONTRIBUTING.rst", "CONTRIBUTING.txt",
         ".github/CONTRIBUTING.md", ".github/PULL_REQUEST_TEMPLATE.md",
     ]
     content = ""
-    for f in guideline_files:
-        path = os.path.join(REPO_PATH, f)
-        if os.path.isfile(path):
-            print(f"  Found: {f}")
-            with open(path) as fh:
-                # Read first 200 lines
-                lines = []
-                for i, line in enumerate(fh):
-                    if i >= 200:
-                        break
-                    lines.append(line)
-                content += f"\n--- {f} ---\n{''.join(lines)}\n"
+    for f in _existing_files(repo_path, guideline_files):
+        print(f"  Found: {f}")
+        text = _read_head(os.path.join(repo_path, f), _GUIDELINES_MAX_CHARS)
+        content += f"\n--- {f} ---\n{text}\n"
     if not content:
         print("  No contributing guidelines found.")
     return content
@@ -172,6 +305,9 @@ Working on issue #{issue.number}: {issue.title}
 
 def cleanup_inner_claude_md() -> None:
     """Remove the inner CLAUDE.md after work is done."""
+    # Claude has changed the tree; don't serve its pre-work snapshot again
+    _read_contributing_guidelines.cache_clear()
+    _gather_repo_context.cache_clear()
     path = os.path.join(REPO_PATH, "CLAUDE.md")
     try:
         os.remove(path)
@@ -179,103 +315,321 @@ def cleanup_inner_claude_md() -> None:
         pass
 
 
+_TREE_SKIP_DIRS = frozenset({".git", "node_modules", ".venv", "vendor", "__pycache__"})
+_MAX_TREE_FILES = 200
+
+
+def _list_files(repo_path: str, limit: int) -> list[str]:
+    """Files in the top two levels of ``repo_path``, sorted.
+
+    Stops once more than ``limit`` are found, so the caller can tell the
+    listing was cut short without walking the rest.
+    """
+    files: list[str] = []
+    try:
+        with os.scandir(repo_path) as it:
+            top = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return files
+    for entry in top:
+        if entry.is_file(follow_symlinks=False):
+            files.append(f"./{entry.name}")
+        elif entry.is_dir(follow_symlinks=False) and entry.name not in _TREE_SKIP_DIRS:
+            try:
+                with os.scandir(entry.path) as it:
+                    names = sorted(e.name for e in it if e.is_file(follow_symlinks=False))
+            except OSError:
+                continue
+            files.extend(f"./{entry.name}/{name}" for name in names)
+        if len(files) > limit:
+            break
+    return files
+
+
 def gather_repo_context() -> str:
     """Pre-gather repository context to reduce Claude's exploration overhead."""
+    head = _head_commit(REPO_PATH)
+    if head is None:
+        return _gather_repo_context.__wrapped__(REPO_PATH, head)
+    return _gather_repo_context(REPO_PATH, head)
+
+
+@functools.lru_cache(maxsize=4)
+def _gather_repo_context(repo_path: str, head: str | None) -> str:
     context_parts: list[str] = []
 
-    # 1. Directory tree (top 2 levels, skip hidden/vendor dirs)
-    result = subprocess.run(
-        ["find", ".", "-maxdepth", "2", "-type", "f",
-         "-not", "-path", "./.git/*",
-         "-not", "-path", "./node_modules/*",
-         "-not", "-path", "./.venv/*",
-         "-not", "-path", "./vendor/*",
-         "-not", "-path", "./__pycache__/*"],
-        capture_output=True, text=True, cwd=REPO_PATH,
-    )
-    if result.returncode == 0:
-        files = result.stdout.strip().splitlines()
+    # 1. Directory tree (top 2 levels, skip VCS/vendor dirs)
+    files = _list_files(repo_path, _MAX_TREE_FILES)
+    if len(files) > _MAX_TREE_FILES:
+        files = files[:_MAX_TREE_FILES]
+        context_parts.append(f"## Repository file tree (top 2 levels, first {len(files)} files):")
+    else:
         context_parts.append(f"## Repository file tree (top 2 levels, {len(files)} files):")
-        context_parts.append("\n".join(files[:200]))
-
-    # 2. README (first 100 lines)
-    for readme in ["README.md", "README.rst", "README.txt", "README"]:
-        path = os.path.join(REPO_PATH, readme)
-        if os.path.isfile(path):
-            with open(path) as f:
-                lines = []
-                for i, line in enumerate(f):
-                    if i >= 100:
-                        break
-                    lines.append(line)
-            context_parts.append(f"\n## {readme} (first 100 lines):\n{''.join(lines)}")
-            break
+    context_parts.append("\n".join(files))
+
+    # 2. README (first ~6KB)
+    readmes = _existing_files(repo_path, ["README.md", "README.rst", "README.txt", "README"])
+    if readmes:
+        readme = readmes[0]
+        text = _read_head(os.path.join(repo_path, readme), _README_MAX_CHARS)
+        context_parts.append(f"\n## {readme} (beginning):\n{text}")
 
     # 3. Package metadata (first 3KB)
-    for meta_file in ["pyproject.toml", "package.json", "Cargo.toml", "go.mod",
-                       "pom.xml", "setup.py", "setup.cfg"]:
-        path = os.path.join(REPO_PATH, meta_file)
-        if os.path.isfile(path):
-            with open(path) as f:
-                content = f.read(3000)
-            context_parts.append(f"\n## {meta_file}:\n{content}")
-            break
+    meta_files = ["pyproject.toml", "package.json", "Cargo.toml", "go.mod",
+                  "pom.xml", "setup.py", "setup.cfg"]
+    found = _existing_files(repo_path, meta_files)
+    if found:
+        meta_file = found[0]
+        with open(os.path.join(repo_path, meta_file)) as f:
+            content = f.read(3000)
+        context_parts.append(f"\n## {meta_file}:\n{content}")
 
     return "\n".join(context_parts)
 
 
+_COAUTHOR_RE = re.compile(r"^co-authored-by:.*\n?", re.IGNORECASE | re.MULTILINE)
+
+# One record per commit: hash, tree, parents, author/committer identity and
+# date, then the raw message; \x1f between fields, \x1e after each record
+_COMMIT_FIELDS = ["%H", "%T", "%P", "%an", "%ae", "%aI", "%cn", "%ce", "%cI", "%B"]
+
+
 def _strip_coauthor_trailers(default_branch: str) -> None:
     """Rewrite commits on the feature branch to remove Co-Authored-By trailers.
 
     Claude Code automatically adds these to commits it creates, but we don't
-    want to expose that in PRs to upstream repos.
+    want to expose that in PRs to upstream repos. Commits are read with one
+    git log and only those from the first affected one onwards are recreated
+    with commit-tree; trees are unchanged, so nothing is checked out.
     """
-    subprocess.run(
-        ["git", "filter-branch", "-f", "--msg-filter",
-         r"sed '/^[Cc]o-[Aa]uthored-[Bb]y:/d'",
+    log = subprocess.run(
+        ["git", "log", "--reverse", f"--format={'%x1f'.join(_COMMIT_FIELDS)}%x1e",
          f"upstream/{default_branch}..HEAD"],
-        capture_output=True, cwd=REPO_PATH,
+        capture_output=True, text=True, cwd=REPO_PATH,
     )
+    if log.returncode != 0:
+        return
+
+    rewritten: dict[str, str] = {}
+    new_head = None
+    for record in log.stdout.split("\x1e"):
+        record = record.lstrip("\n")
+        if not record:
+            continue
+        fields = record.split("\x1f")
+        if len(fields) != len(_COMMIT_FIELDS):
+            return  # not the output we asked for; leave the branch alone
+        sha, tree, parents, an, ae, ad, cn, ce, cd, message = fields
+        cleaned = _COAUTHOR_RE.sub("", message).rstrip() + "\n"
+        new_parents = [rewritten.get(p, p) for p in parents.split()]
+        if cleaned == message.rstrip() + "\n" and new_parents == parents.split():
+            continue  # untouched so far
+        env = dict(
+            os.environ,
+            GIT_AUTHOR_NAME=an, GIT_AUTHOR_EMAIL=ae, GIT_AUTHOR_DATE=ad,
+            GIT_COMMITTER_NAME=cn, GIT_COMMITTER_EMAIL=ce, GIT_COMMITTER_DATE=cd,
+        )
+        cmd = ["git", "commit-tree", tree]
+        for parent in new_parents:
+            cmd += ["-p", parent]
+        result = subprocess.run(
+            cmd, input=cleaned, capture_output=True, text=True, env=env, cwd=REPO_PATH,
+        )
+        if result.returncode != 0:
+            return  # leave the branch as it was
+        new_head = rewritten[sha] = result.stdout.strip()
+
+    if new_head is not None:
+        subprocess.run(
+            ["git", "update-ref", "-m", "strip co-author trailers", "HEAD", new_head],
+            capture_output=True, cwd=REPO_PATH,
+        )
 
 
-def commit_changes(issue_number: int, default_branch: str, logger: RunLogger | None = None) -> bool:
-    """Stage and commit all changes if Claude forgot to. Returns True if there were changes."""
-    def _run(cmd, **kwargs):
-        r = subprocess.run(cmd, **kwargs)
-        if logger:
-            stdout = ""
-            stderr = ""
-            if kwargs.get("capture_output"):
-                stdout = r.stdout if isinstance(r.stdout, str) else (r.stdout or b"").decode("utf-8", errors="replace")
-                stderr = r.stderr if isinstance(r.stderr, str) else (r.stderr or b"").decode("utf-8", errors="replace")
-            logger.log_subprocess(cmd, r.returncode, stdout, stderr)
-        return r
+def _parse_status(output: str, upstream: str) -> tuple[list[str], int | None]:
+    """Split ``git status --porcelain=v2 --branch`` output.
+
+    Returns the changed/untracked entries and the number of commits ahead
+    of ``upstream``, or None when the branch doesn't track it.
+    """
+    changes: list[str] = []
+    tracked = False
+    ahead = None
+    for line in output.splitlines():
+        if line.startswith("# branch.upstream "):
+            tracked = line.split(" ", 2)[2] == upstream
+        elif line.startswith("# branch.ab "):
+            ahead = int(line.split()[2].lstrip("+"))
+        elif line and not line.startswith("#"):
+            changes.append(line)
+    return changes, ahead if tracked else None
+
+
+def commit_changes(
+    issue_number: int,
+    default_branch: str,
+    logger: RunLogger | None = None,
+    *,
+    return_diff: bool = False,
+) -> bool | tuple[bool, str]:
+    """Stage and commit all changes if Claude forgot to. Returns True if there were changes.
+
+    With ``return_diff=True``, returns ``(committed, diff)`` instead, where
+    ``diff`` is capture_diff() against upstream ("" if nothing changed). The
+    diff doubles as the check for existing commits, saving a git call.
+    """
+    _run = _make_runner(logger)
 
-    # Check if there are uncommitted changes
+    # Uncommitted changes, plus how far the branch is ahead of the upstream
+    # branch it tracks (create_branch sets that up), in one call
     status = _run(
-        ["git", "status", "--porcelain"],
+        ["git", "status", "--porcelain=v2", "--branch"],
         capture_output=True, text=True, cwd=REPO_PATH,
     )
-    if not status.stdout.strip():
-        # Check if there are already commits beyond the base branch
-        log = _run(
-            ["git", "log", f"upstream/{default_branch}..HEAD", "--oneline"],
-            capture_output=True, text=True, cwd=REPO_PATH,
-        )
-        if log.stdout.strip():
+    changes, ahead = _parse_status(status.stdout, f"upstream/{default_branch}")
+    if not changes:
+        # Check if there are already commits beyond the base branch — with a
+        # clean tree, a non-empty diff against upstream means there are
+        if ahead is not None:
+            has_commits = ahead > 0
+            diff = capture_diff(default_branch) if has_commits and return_diff else ""
+        elif return_diff:
+            diff = capture_diff(default_branch)
+            has_commits = bool(diff.strip())
+        else:
+            log = _run(
+                ["git", "log", f"upstream/{default_branch}..HEAD", "--oneline"],
+                capture_output=True, text=True, cwd=REPO_PATH,
+            )
+            has_commits = bool(log.stdout.strip())
+        if has_commits:
             # Strip co-author trailers from existing commits
             _strip_coauthor_trailers(default_branch)
-            return True  # Claude committed properly
+            return (True, diff) if return_diff else True  # Claude committed properly
         print("  WARNING: No changes were made.")
-        return False
+        return (False, "") if return_diff else False
 
     print("  Committing uncommitted changes...")
-    _run(["git", "add", "-A"], check=True, cwd=REPO_PATH)
-    _run(
-        ["git", "commit", "-m", f"fix: address issue #{issue_number}"],
-        check=True, cwd=REPO_PATH,
+    commit = ["git", "commit", "-m", f"fix: address issue #{issue_number}"]
+    if any(line.startswith("? ") for line in changes):
+        # commit -a only picks up tracked files; new ones need an explicit add
+        _run(["git", "add", "-A"], check=True, cwd=REPO_PATH)
+    else:
+        commit.insert(2, "-a")
+    _run(commit, check=True, cwd=REPO_PATH)
+    return (True, capture_diff(default_branch)) if return_diff else True
+
+
+def capture_diff(default_branch: str, max_bytes: int = 50_000, echo: bool = False) -> str:
+    """Return the diff against upstream, reading at most ``max_bytes`` of it.
+
+    The patch is preceded by a --stat summary of every file, from the same
+    git process. git is cut off once the cap is reached rather than
+    rendering the whole diff. With ``echo``, the full diff is also streamed
+    to stdout as it is read, while only the first ``max_bytes`` are kept.
+    """
+    proc = subprocess.Popen(
+        ["git", "--no-pager", "diff", "--patch-with-stat", f"upstream/{default_branch}"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=REPO_PATH,
     )
-    return True
+    if echo:
+        sys.stdout.flush()  # keep earlier print()s ahead of the raw bytes
+    data = bytearray()
+    while len(data) <= max_bytes:
+        chunk = proc.stdout.read(min(65536, max_bytes + 1 - len(data)))
+        if not chunk:
+            break
+        data += chunk
+        if echo:
+            sys.stdout.buffer.write(chunk)
+    if echo:
+        shutil.copyfileobj(proc.stdout, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    proc.stdout.close()  # git gets SIGPIPE if it still has output
+    proc.wait()
+
+    diff = data[:max_bytes].decode("utf-8", errors="replace")
+    if len(data) > max_bytes:
+        diff += f"\n... (diff truncated at {max_bytes} bytes)\n"
+    return diff
+
+
+_FILE_DIFF_RE = re.compile(r"^(?=diff --git )", re.MULTILINE)
+
+
+def compact_diff(default_branch: str, max_bytes: int = 16_000) -> str:
+    """Return a --stat summary plus as many whole per-file diffs as fit.
+
+    Files are added in path order; one that would overflow ``max_bytes`` is
+    skipped (and named) rather than cut mid-hunk, so smaller files later in
+    the list still make it in. The returned text, note included, is at most
+    ``max_bytes`` of UTF-8.
+    """
+    # One diff for the whole branch, split on the per-file headers, rather
+    # than a git process per changed file
+    out = subprocess.run(
+        ["git", "--no-pager", "diff", "--patch-with-stat", f"upstream/{default_branch}"],
+        capture_output=True, text=True, encoding="utf-8", errors="replace", cwd=REPO_PATH,
+    ).stdout
+    stat, *file_diffs = _FILE_DIFF_RE.split(out)
+    if stat.endswith("\n\n"):
+        stat = stat[:-1]
+    if len(stat.encode()) > max_bytes:
+        stat = _clip_lines(stat, max_bytes)
+
+    # Each part after the stat costs its size plus the "\n" joining it on
+    budget = max_bytes - len(stat.encode())
+    kept: list[tuple[str, str]] = []
+    skipped: list[str] = []
+    for file_diff in file_diffs:
+        name = _diff_file_name(file_diff)
+        size = len(file_diff.encode()) + 1
+        if size > budget:
+            skipped.append(name)
+            continue
+        kept.append((name, file_diff))
+        budget -= size
+
+    note = ""
+    if skipped:
+        note = f"... (diff omitted for {', '.join(skipped)})\n"
+        # Give up the last files kept until the note fits too
+        while len(note.encode()) + 1 > budget and kept:
+            name, file_diff = kept.pop()
+            budget += len(file_diff.encode()) + 1
+            skipped.append(name)
+            note = f"... (diff omitted for {', '.join(skipped)})\n"
+        if len(note.encode()) + 1 > budget:
+            note = f"... (diff omitted for {len(skipped)} files)\n"
+        if len(note.encode()) + 1 > budget:
+            note = ""
+    parts = [stat, *(file_diff for _, file_diff in kept)]
+    if note:
+        parts.append(note)
+    return "\n".join(parts)
+
+
+def _diff_file_name(file_diff: str) -> str:
+    """Path a single-file ``diff --git`` section is about (the new one if renamed)."""
+    lines = file_diff.split("\n")
+    for line in lines[1:]:
+        if line.startswith(("rename to ", "copy to ")):
+            return line.split(" ", 2)[2]
+        if line.startswith(("@@", "---", "Binary files")):
+            break
+    # Otherwise the header names the same path twice: "a/<path> b/<path>"
+    header = lines[0][len("diff --git "):]
+    half = (len(header) - 1) // 2
+    if header.startswith('"'):  # quoted: "a/<path>" "b/<path>"
+        return header[3:half - 1]
+    return header[2:half]
+
+
+def _clip_lines(text: str, max_bytes: int) -> str:
+    """``text`` cut to whole lines within ``max_bytes`` of UTF-8."""
+    clipped = text.encode()[:max_bytes].decode("utf-8", errors="ignore")
+    cut = clipped.rfind("\n")
+    return clipped[:cut + 1] if cut != -1 else ""
 
 
 def push_branch(branch: str, logger: RunLogger | None = None) -> None:
@@ -283,8 +637,5 @@ def push_branch(branch: str, logger: RunLogger | None = None) -> None:
     print(f"[9/9] Pushing branch {branch} to fork...")
     cmd = ["git", "push", "--force", "origin", branch]
     # --force is intentional: supports retries if the branch was already pushed
-    result = subprocess.run(cmd, check=True, cwd=REPO_PATH, capture_output=True)
-    if logger:
-        stdout = result.stdout if isinstance(result.stdout, str) else (result.stdout or b"").decode("utf-8", errors="replace")
-        stderr = result.stderr if isinstance(result.stderr, str) else (result.stderr or b"").decode("utf-8", errors="replace")
-        logger.log_subprocess(cmd, result.returncode, stdout, stderr)
+    _run = _make_runner(logger)
+    _run(cmd, check=True, cwd=REPO_PATH, capture_output=True)
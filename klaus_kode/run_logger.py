@@ -1,6 +1,7 @@
 """Structured JSONL run logger for AI-debuggability.
 
 Emits one JSON object per line to a file at /workspace/logs/run_TIMESTAMP_RUNID.jsonl.
+File writes happen on a background thread so logging never blocks the pipeline.
 At run end, also prints all entries between marker lines as a fallback if the volume
 mount is missing.
 """
@@ -10,65 +11,153 @@ from __future__ import annotations
 import datetime
 import json
 import os
+import queue
+import threading
 import time
-import uuid
 
 
 # Cap subprocess stdout/stderr at 10 KB to avoid bloating the log
 _MAX_SUBPROCESS_OUTPUT = 10 * 1024
+# Tool results keep this much from each end (errors tend to be at the end)
+_TOOL_OUTPUT_EDGE = 4 * 1024
 
 _JSONL_START_MARKER = "===KLAUS_KODE_JSONL_START==="
 _JSONL_END_MARKER = "===KLAUS_KODE_JSONL_END==="
 
 
+def _clip_output(output: str | bytes) -> str:
+    """Cap captured output, cutting raw bytes before decoding only what's kept."""
+    if len(output) > _MAX_SUBPROCESS_OUTPUT:
+        output = output[:_MAX_SUBPROCESS_OUTPUT]
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output
+
+
+def _elide_middle(output: str) -> str:
+    """Keep the head and tail of a long tool result, noting what was cut."""
+    if len(output) <= 2 * _TOOL_OUTPUT_EDGE:
+        return output
+    elided = len(output) - 2 * _TOOL_OUTPUT_EDGE
+    return (
+        f"{output[:_TOOL_OUTPUT_EDGE]}\n...[{elided} chars elided]...\n"
+        f"{output[-_TOOL_OUTPUT_EDGE:]}"
+    )
+
+
+# Shared encoder: json.dumps(..., default=str) would build a new one per entry.
+# Entries are fresh dicts, so the circular-reference bookkeeping is skipped,
+# and compact separators keep the JSONL lines short.
+_ENCODER = json.JSONEncoder(default=str, check_circular=False, separators=(",", ":"))
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_entries(log_path: str):
+    """Yield the entries of a run log, decoding the whole file in one pass."""
+    with open(log_path, encoding="utf-8") as f:
+        data = f.read()
+    end = len(data)
+    i = 0
+    while i < end:
+        if data[i] in _WHITESPACE:
+            i += 1
+            continue
+        entry, i = _DECODER.raw_decode(data, i)
+        yield entry
+
+
+# Queued to tell the writer thread to drain and exit
+_STOP = object()
+
+
 class RunLogger:
-    """Line-buffered JSONL logger for a single klaus-kode run."""
+    """Batched JSONL logger for a single klaus-kode run."""
 
     def __init__(self, log_dir: str = "/workspace/logs") -> None:
-        self.run_id = uuid.uuid4().hex[:8]
+        self.run_id = os.urandom(4).hex()
         self._start_time = time.time()
+        # Wall clock is recorded once; entries carry elapsed_s relative to it
+        self._start_iso = datetime.datetime.fromtimestamp(self._start_time).isoformat()
         self._context: dict = {}
         self._current_step: str | None = None
         self._step_start_time: float | None = None
-        self._entries: list[str] = []  # raw JSON lines for final dump
+        self._entries: list[str] = []  # raw JSON lines, kept only when there's no file
 
-        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        ts = datetime.datetime.fromtimestamp(self._start_time).strftime("%Y%m%d_%H%M%S")
         self._log_dir = log_dir
         self._log_path = os.path.join(log_dir, f"run_{ts}_{self.run_id}.jsonl")
         self._file = None
 
         try:
             os.makedirs(log_dir, exist_ok=True)
-            self._file = open(self._log_path, "w", buffering=1)  # line-buffered
+            self._file = open(self._log_path, "w")  # flushed per batch by the writer
         except OSError:
             # Volume mount may be missing — entries will be dumped to stdout at end
             self._file = None
 
+        if self._file is not None:
+            self._queue: queue.Queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._write_loop, name="run-logger", daemon=True,
+            )
+            self._writer.start()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _emit(self, entry: dict) -> None:
-        """Write a single JSON line to the log file and buffer."""
+        """Encode an entry and queue it for the writer thread.
+
+        Without a log file it is kept in memory instead, for
+        flush_final_summary() to print.
+        """
         entry["run_id"] = self.run_id
-        entry["timestamp"] = datetime.datetime.now().isoformat()
-        entry["elapsed_s"] = round(time.time() - self._start_time, 2)
+        entry["elapsed_s"] = round(time.time() - self._start_time, 3)
         if self._current_step:
             entry.setdefault("step", self._current_step)
-        line = json.dumps(entry, default=str)
-        self._entries.append(line)
+        line = _ENCODER.encode(entry)
         if self._file is not None:
+            self._queue.put(line)
+        else:
+            self._entries.append(line)
+
+    def _write_loop(self) -> None:
+        """Writer thread: append queued lines to the log file until stopped.
+
+        Whatever has queued up since the last pass is written and flushed
+        together, so a burst of events costs one write.
+        """
+        stopped = False
+        while not stopped:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            received = len(batch)
+            if _STOP in batch:
+                batch = batch[:batch.index(_STOP)]
+                stopped = True
             try:
-                self._file.write(line + "\n")
+                self._file.write("".join(line + "\n" for line in batch))
+                self._file.flush()
             except OSError:
                 pass
+            for _ in range(received):
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until everything logged so far has been written to the file."""
+        if self._file is not None:
+            self._queue.join()
 
     # ------------------------------------------------------------------
     # Public event methods
     # ------------------------------------------------------------------
 
     def log_run_start(self, args: dict) -> None:
-        self._emit({"type": "run_start", "args": args})
+        self._emit({"type": "run_start", "start_iso": self._start_iso, "args": args})
 
     def set_context(self, **kw) -> None:
         self._context.update(kw)
@@ -97,7 +186,7 @@ class RunLogger:
             "type": "tool_result",
             "tool_id": tool_id,
             "tool_name": name,
-            "tool_output": output,
+            "tool_output": _elide_middle(output),
             "is_error": is_error,
         })
 
@@ -136,15 +225,15 @@ class RunLogger:
         self,
         cmd: list[str] | str,
         returncode: int | None,
-        stdout: str = "",
-        stderr: str = "",
+        stdout: str | bytes = "",
+        stderr: str | bytes = "",
     ) -> None:
         self._emit({
             "type": "subprocess",
             "cmd": cmd if isinstance(cmd, str) else " ".join(cmd),
             "returncode": returncode,
-            "stdout": stdout[:_MAX_SUBPROCESS_OUTPUT],
-            "stderr": stderr[:_MAX_SUBPROCESS_OUTPUT],
+            "stdout": _clip_output(stdout),
+            "stderr": _clip_output(stderr),
         })
 
     def log_decision(self, decision: str, reason: str, **kw) -> None:
@@ -170,7 +259,9 @@ class RunLogger:
     def flush_final_summary(self) -> None:
         """Print all entries between markers only if the log file could not be written."""
         if self._file is not None:
-            # Log file was written successfully — just close it
+            # Let the writer drain what's queued, then close the file
+            self._queue.put(_STOP)
+            self._writer.join()
             try:
                 self._file.close()
             except OSError:
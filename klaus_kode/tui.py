@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import json
+from typing import Callable
 
 # ---------------------------------------------------------------------------
 # Status verbs for spinner animation
 # ---------------------------------------------------------------------------
 
-STATUS_VERBS = [
+STATUS_VERBS = (
     "Thinking", "Reasoning", "Analyzing", "Contemplating", "Processing",
     "Evaluating", "Investigating", "Exploring", "Synthesizing", "Reflecting",
     "Sauteing", "Catapulting", "Percolating", "Marinating", "Simmering",
     "Fermenting", "Distilling", "Crystallizing", "Composting", "Braising",
-]
+)
 
 SPINNER_CHARS = "\u280b\u2819\u2839\u2838\u283c\u2834\u2826\u2827\u2807\u280f"
 
@@ -28,32 +29,53 @@ DIM = "\033[2m"
 RESET = "\033[0m"
 
 
+def _format_write(inp: dict) -> str:
+    path = inp.get("file_path", "?")
+    content = inp.get("content", "")
+    return f" \u2192 {path} ({len(content)} chars)"
+
+
+def _format_edit(inp: dict) -> str:
+    path = inp.get("file_path", "?")
+    old = (inp.get("old_string", "") or "")[:60]
+    return f" \u2192 {path} (replacing: {old!r}...)"
+
+
+def _format_bash(inp: dict) -> str:
+    desc = inp.get("description", "")
+    if desc:
+        return f" \u2192 {desc}"
+    return f" \u2192 {inp.get('command', '?')[:200]}"
+
+
+def _format_as_json(inp: dict) -> str:
+    # Only 150 chars are shown, so long strings (e.g. a Task prompt) are cut
+    # before encoding; the shown prefix comes out the same
+    clipped = {k: v[:150] if isinstance(v, str) else v for k, v in inp.items()}
+    return f" \u2192 {json.dumps(clipped)[:150]}"
+
+
+# One-line summaries of the built-in tools' inputs, looked up by tool name
+_TOOL_FORMATTERS: dict[str, Callable[[dict], str]] = {
+    "Read": lambda inp: f" \u2192 {inp.get('file_path', '?')}",
+    "Write": _format_write,
+    "Edit": _format_edit,
+    "Bash": _format_bash,
+    "Glob": lambda inp: f" \u2192 {inp.get('pattern', '?')}",
+    "Grep": lambda inp: f" \u2192 /{inp.get('pattern', '?')}/ in {inp.get('path', '.')}",
+    "Task": _format_as_json,
+    "WebSearch": _format_as_json,
+    "WebFetch": _format_as_json,
+}
+
+
 def format_tool_input(tool_name: str, inp: dict) -> str:
     """Format tool input into a concise one-line summary."""
     if not inp:
         return ""
-    if tool_name == "Read":
-        return f" \u2192 {inp.get('file_path', '?')}"
-    if tool_name == "Write":
-        path = inp.get("file_path", "?")
-        content = inp.get("content", "")
-        return f" \u2192 {path} ({len(content)} chars)"
-    if tool_name == "Edit":
-        path = inp.get("file_path", "?")
-        old = (inp.get("old_string", "") or "")[:60]
-        return f" \u2192 {path} (replacing: {old!r}...)"
-    if tool_name == "Bash":
-        cmd = inp.get("command", "?")
-        desc = inp.get("description", "")
-        if desc:
-            return f" \u2192 {desc}"
-        return f" \u2192 {cmd[:200]}"
-    if tool_name == "Glob":
-        return f" \u2192 {inp.get('pattern', '?')}"
-    if tool_name == "Grep":
-        return f" \u2192 /{inp.get('pattern', '?')}/ in {inp.get('path', '.')}"
-    if tool_name in ("Task", "WebSearch", "WebFetch"):
-        return f" \u2192 {json.dumps(inp)[:150]}"
+    formatter = _TOOL_FORMATTERS.get(tool_name)
+    if formatter is not None:
+        return formatter(inp)
     # Generic: show first key-value
     for k, v in inp.items():
         return f" \u2192 {k}={str(v)[:100]}"
@@ -61,22 +83,23 @@ def format_tool_input(tool_name: str, inp: dict) -> str:
 
 
 def print_tool_result_output(output: str, verbose: int) -> None:
-    """Print tool result output at the appropriate verbosity level."""
-    if not output:
+    """Print tool result output at the appropriate verbosity level.
+
+    Below verbose=2 only the first few lines are split off; the rest of a
+    (possibly huge) output is just counted. Everything goes out in one write.
+    """
+    text = output.strip()
+    if not text:
         return
-    lines = output.strip().splitlines()
     if verbose >= 2:
-        for ol in lines:
-            print(f"    {DIM}{ol}{RESET}", flush=True)
-    elif verbose >= 1:
-        show = lines[:5]
-        for ol in show:
-            print(f"    {DIM}{ol[:200]}{RESET}", flush=True)
-        if len(lines) > 5:
-            print(f"    {DIM}... ({len(lines) - 5} more lines){RESET}", flush=True)
+        shown = text.splitlines()
     else:
-        show = lines[:3]
-        for ol in show:
-            print(f"    {DIM}{ol[:120]}{RESET}", flush=True)
-        if len(lines) > 3:
-            print(f"    {DIM}... ({len(lines) - 3} more lines){RESET}", flush=True)
+        limit, width = (5, 200) if verbose >= 1 else (3, 120)
+        parts = text.split("\n", limit)
+        shown = [ol.rstrip("\r")[:width] for ol in parts[:limit]]
+        if len(parts) > limit:
+            more = parts[limit].count("\n") + 1
+            shown.append(f"... ({more} more lines)")
+    # Each line is dimmed on its own: a reset inside the tool output then
+    # only undims the rest of its own line
+    print("\n".join(f"{DIM}    {line}{RESET}" for line in shown), flush=True)
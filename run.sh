@@ -3,6 +3,7 @@ set -euo pipefail
 
 IMAGE="klaus-kode"
 LOG_DIR="logs"
+CACHE_DIR=".cache"
 
 # --- Usage ---
 # Mode 1: explicit repo + explicit issue
@@ -28,6 +29,10 @@ LOG_DIR="logs"
 # Required env vars:
 #   GH_TOKEN               GitHub PAT (classic with public_repo, or fine-grained with Contents + PRs read/write)
 #   ANTHROPIC_API_KEY       Anthropic API key  (or CLAUDE_CODE_OAUTH_TOKEN)
+#
+# Optional env vars:
+#   KLAUS_KODE_CLONE_CACHE Set to 1 to keep a clone per repo and update it on later runs
+#   KLAUS_KODE_LLM_CACHE   Set to 1 to reuse cached answers to the short Claude queries
 
 # Auto-load .env file if present (supports KEY=value format)
 if [ -f .env ]; then
@@ -47,6 +52,7 @@ if [ -z "${ANTHROPIC_API_KEY:-}" ] && [ -z "${CLAUDE_CODE_OAUTH_TOKEN:-}" ]; the
 fi
 
 mkdir -p "$LOG_DIR" && chmod 777 "$LOG_DIR"
+mkdir -p "$CACHE_DIR" && chmod 777 "$CACHE_DIR"
 LOGFILE="${LOG_DIR}/run_$(date +%Y%m%d_%H%M%S).log"
 echo "==> Logging to ${LOGFILE}"
 
@@ -57,9 +63,12 @@ echo "==> Logging to ${LOGFILE}"
   echo "==> Running klaus-kode..."
   docker run --rm \
     -v "$(pwd)/logs:/workspace/logs" \
+    -v "$(pwd)/${CACHE_DIR}:/home/claude/.cache/klaus-kode" \
     -e GH_TOKEN \
     -e ANTHROPIC_API_KEY="${ANTHROPIC_API_KEY:-}" \
     -e CLAUDE_CODE_OAUTH_TOKEN="${CLAUDE_CODE_OAUTH_TOKEN:-}" \
+    -e KLAUS_KODE_CLONE_CACHE="${KLAUS_KODE_CLONE_CACHE:-}" \
+    -e KLAUS_KODE_LLM_CACHE="${KLAUS_KODE_LLM_CACHE:-}" \
     "$IMAGE" \
     "$@"
 } 2>&1 | tee "$LOGFILE"
@@ -6,6 +6,7 @@ ever happen during testing.
 
 from __future__ import annotations
 
+import http.client
 import os
 import subprocess
 import sys
@@ -64,6 +65,32 @@ def _block_dangerous_subprocesses(request):
     subprocess.run = _real_subprocess_run
 
 
+# ---------------------------------------------------------------------------
+# Safety net: block real GitHub API calls at the connection level
+# ---------------------------------------------------------------------------
+
+_real_https_connect = http.client.HTTPSConnection.connect
+
+
+def _guarded_https_connect(self):
+    raise RuntimeError(f"SAFETY: test tried to connect to {self.host}")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _block_network():
+    """Session-wide guard that prevents accidental GitHub API requests."""
+    http.client.HTTPSConnection.connect = _guarded_https_connect
+    yield
+    http.client.HTTPSConnection.connect = _real_https_connect
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the on-disk cache at a per-test temp dir instead of ~/.cache."""
+    import klaus_kode.cache as cache
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path / "cache"))
+
+
 # ---------------------------------------------------------------------------
 # Domain fixtures
 # ---------------------------------------------------------------------------
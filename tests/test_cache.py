@@ -0,0 +1,79 @@
+"""Tests for klaus_kode.cache — best-effort on-disk cache helpers."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import klaus_kode.cache as cache
+
+
+class TestFreshness:
+    def test_missing_entry_is_not_fresh(self):
+        assert cache.is_fresh("nope", ttl=60) is False
+
+    def test_touch_makes_entry_fresh(self):
+        cache.touch("marker")
+        assert os.path.exists(cache.cache_path("marker"))
+        assert cache.is_fresh("marker", ttl=60) is True
+
+    def test_stale_entry_is_not_fresh(self):
+        cache.touch("marker")
+        old = time.time() - 3600
+        os.utime(cache.cache_path("marker"), (old, old))
+        assert cache.is_fresh("marker", ttl=60) is False
+
+    def test_touch_ignores_unwritable_dir(self, monkeypatch, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setattr(cache, "CACHE_DIR", str(blocker / "sub"))
+        cache.touch("marker")  # Should not raise
+        assert cache.is_fresh("marker", ttl=60) is False
+
+
+class TestJsonEntries:
+    def test_round_trip(self):
+        cache.write_json("entry.json", {"default_branch": "main"})
+        assert cache.read_json("entry.json") == {"default_branch": "main"}
+
+    def test_missing_entry_is_none(self):
+        assert cache.read_json("missing.json") is None
+
+    def test_corrupt_entry_is_none(self):
+        cache.touch("bad.json")
+        assert cache.read_json("bad.json") is None
+
+
+class TestDiskMemoize:
+    def test_reuses_result_within_ttl(self):
+        calls = []
+
+        @cache.disk_memoize(60)
+        def lookup(name):
+            calls.append(name)
+            return {"name": name}
+
+        assert lookup("a") == {"name": "a"}
+        assert lookup("a") == {"name": "a"}
+        assert lookup("b") == {"name": "b"}
+        assert calls == ["a", "b"]
+
+    def test_falsy_results_are_not_cached(self):
+        calls = []
+
+        @cache.disk_memoize(60)
+        def exists(name):
+            calls.append(name)
+            return False
+
+        exists("a")
+        exists("a")
+        assert calls == ["a", "a"]
+
+    def test_decode_applied_on_hit(self):
+        @cache.disk_memoize(60, encode=list, decode=tuple)
+        def pair():
+            return (1, 2)
+
+        assert pair() == (1, 2)
+        assert pair() == (1, 2)
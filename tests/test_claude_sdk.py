@@ -0,0 +1,25 @@
+"""Tests for klaus_kode.claude_sdk — event loop reuse only, NO Claude calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from klaus_kode.claude_sdk import run_sync
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+class TestRunSync:
+    def test_reuses_loop_within_thread(self):
+        assert run_sync(_current_loop()) is run_sync(_current_loop())
+
+    def test_each_thread_gets_its_own_loop(self):
+        main_loop = run_sync(_current_loop())
+        other: list = []
+        thread = threading.Thread(target=lambda: other.append(run_sync(_current_loop())))
+        thread.start()
+        thread.join()
+        assert other[0] is not main_loop
@@ -14,8 +14,8 @@ class TestCliArgParsing:
         Session.load returns a MagicMock where is_completed() is truthy,
         so all pipeline steps are skipped and main() returns normally.
         """
-        with patch("klaus_kode.cli.RunLogger"), \
-             patch("klaus_kode.cli.Session.load"):
+        with patch("klaus_kode.run_logger.RunLogger"), \
+             patch("klaus_kode.context.Session.load"):
             from klaus_kode.cli import main
             # Should complete without error (all steps skipped via mock session)
             main(["--repo", "a/b", "--issue", "1"])
@@ -33,3 +33,28 @@ class TestCliArgParsing:
             from klaus_kode.cli import main
             main([])
         assert exc_info.value.code == 2
+
+
+class TestFastParseArgs:
+    @pytest.mark.parametrize("argv", [
+        ["--repo", "a/b", "--issue", "1"],
+        ["--repo", "a/b", "--find", "easy", "-vv", "--budget", "2.5"],
+        ["--find-repo", "python cli", "--find", "docs", "--force-check"],
+        ["--repo", "a/b", "-v", "--verbose"],
+    ])
+    def test_matches_argparse(self, argv):
+        from klaus_kode.cli import _fast_parse_args, _parse_args
+        assert vars(_fast_parse_args(argv)) == vars(_parse_args(argv))
+
+    @pytest.mark.parametrize("argv", [
+        ["--help"],
+        ["--repo=a/b"],
+        ["--repo", "a/b", "--issue", "x"],
+        ["--repo", "a/b", "--issue", "1", "--find", "easy"],
+        ["--find-repo", "x", "--issue", "1"],
+        ["--repo", "a/b", "--repo", "c/d"],
+        [],
+    ])
+    def test_defers_to_argparse(self, argv):
+        from klaus_kode.cli import _fast_parse_args
+        assert _fast_parse_args(argv) is None
@@ -44,6 +44,54 @@ class TestSession:
         assert loaded.is_completed("b")
         assert loaded.step_outputs["a"]["result"] == 42
 
+    def test_save_replaces_file_atomically(self, tmp_path):
+        path = tmp_path / "session.json"
+        s = Session(session_file=str(path))
+        s.mark_completed("a")
+        s.save()
+        assert [p.name for p in tmp_path.iterdir()] == ["session.json"]
+
+    def test_mark_completed_appends_to_log(self, tmp_path):
+        s = Session(session_file=str(tmp_path / "session.json"))
+        s.mark_completed("a", {"result": 1})
+        s.mark_completed("b")
+        assert not (tmp_path / "session.json").exists()
+        assert len((tmp_path / "session.log").read_text().splitlines()) == 2
+
+    def test_load_replays_log_over_snapshot(self, tmp_path):
+        path = str(tmp_path / "session.json")
+        s = Session(session_file=path)
+        s.mark_completed("a")
+        s.save()
+        s.mark_completed("b", {"result": 2})
+        with open(s.log_file, "a") as f:
+            f.write('{"step": "c"')  # torn write from a crash
+
+        loaded = Session.load(path)
+        assert loaded.completed_steps == ["a", "b"]
+        assert loaded.step_outputs["b"] == {"result": 2}
+
+    def test_log_compacted_into_snapshot(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Session, "COMPACT_EVERY", 3)
+        path = str(tmp_path / "session.json")
+        s = Session(session_file=path)
+        for name in "abc":
+            s.mark_completed(name)
+        assert not (tmp_path / "session.log").exists()
+        assert Session.load(path).completed_steps == ["a", "b", "c"]
+
+    def test_close_compacts_log_into_snapshot(self, tmp_path):
+        path = str(tmp_path / "session.json")
+        s = Session(session_file=path)
+        s.mark_completed("a")
+        s.mark_completed("b", {"result": 2})
+        s.close()
+        assert s._log is None
+        assert not (tmp_path / "session.log").exists()
+        loaded = Session.load(path)
+        assert loaded.completed_steps == ["a", "b"]
+        assert loaded.step_outputs["b"] == {"result": 2}
+
     def test_load_missing_file_returns_fresh(self, tmp_path):
         loaded = Session.load(str(tmp_path / "nonexistent.json"))
         assert loaded.completed_steps == []
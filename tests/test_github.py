@@ -0,0 +1,351 @@
+"""Tests for klaus_kode.github — pure helpers only, NO network calls."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from klaus_kode import github
+
+
+class TestRateLimiter:
+    def test_acquire_within_capacity_does_not_sleep(self):
+        limiter = github._RateLimiter(3, 60)
+        with patch("klaus_kode.github.time.sleep") as sleep:
+            for _ in range(3):
+                limiter.acquire()
+        sleep.assert_not_called()
+
+    def test_acquire_beyond_capacity_waits_for_refill(self):
+        limiter = github._RateLimiter(1, 60)
+        limiter.acquire()
+        # Refill one permit per second; pretend the sleep let it refill.
+        # Patch the module's reference rather than time.monotonic itself, which
+        # other threads (pool workers, log writers) may be calling too
+        with patch("klaus_kode.github.time") as fake_time:
+            fake_time.monotonic.side_effect = [limiter._updated, limiter._updated + 60]
+            limiter.acquire()
+        fake_time.sleep.assert_called_once()
+        assert fake_time.sleep.call_args[0][0] > 0
+
+
+class TestLimiterFor:
+    def test_search_endpoint_uses_search_bucket(self):
+        assert github._limiter_for("search/repositories") is github._SEARCH_LIMITER
+
+    def test_core_endpoint_uses_core_bucket(self):
+        assert github._limiter_for("repos/o/r/issues/1") is github._CORE_LIMITER
+
+
+def _response(data=None, status=200, headers=None):
+    return github._ApiResponse(status, headers or {}, data, b"")
+
+
+class TestApi:
+    @pytest.fixture(autouse=True)
+    def _empty_get_cache(self, monkeypatch):
+        monkeypatch.setattr(github, "_get_cache", {})
+
+    def _connection(self, status=200, body=b"{}", headers=()):
+        resp = MagicMock(status=status)
+        resp.read.return_value = body
+        resp.getheaders.return_value = list(headers)
+        conn = MagicMock()
+        conn.getresponse.return_value = resp
+        return conn
+
+    def test_sends_token_and_decodes_json(self, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "tok")
+        conn = self._connection(body=b'{"login": "me"}', headers=[("X-OAuth-Scopes", "repo")])
+        monkeypatch.setattr(github._connections, "conn", conn, raising=False)
+        result = github._api("GET", "search/issues", {"q": "repo:o/r is:issue"})
+        method, url = conn.request.call_args.args
+        assert (method, url) == ("GET", "/search/issues?q=repo%3Ao%2Fr+is%3Aissue")
+        assert conn.request.call_args.kwargs["headers"]["Authorization"] == "Bearer tok"
+        assert result.ok and result.data == {"login": "me"}
+        assert result.headers["x-oauth-scopes"] == "repo"
+
+    def test_reconnects_once_on_stale_connection(self, monkeypatch):
+        stale = MagicMock()
+        stale.request.side_effect = ConnectionResetError()
+        fresh = self._connection(status=404, body=b"")
+        monkeypatch.setattr(github._connections, "conn", stale, raising=False)
+        with patch("klaus_kode.github.http.client.HTTPSConnection", return_value=fresh):
+            result = github._api("GET", "repos/o/r")
+        stale.close.assert_called_once()
+        assert result.status == 404 and not result.ok
+        assert github._connections.conn is fresh
+
+    def test_retries_gateway_errors_with_backoff(self):
+        responses = [_response(status=502), _response(status=503), _response({"ok": 1})]
+        with patch("klaus_kode.github._send", side_effect=responses) as send, \
+             patch("klaus_kode.github.time.sleep") as sleep:
+            result = github._api("GET", "repos/o/r")
+        assert result.ok and send.call_count == 3
+        first, second = (c.args[0] for c in sleep.call_args_list)
+        assert 0.5 <= first < 0.6 and 1.0 <= second < 1.1
+
+    def test_secondary_rate_limit_honours_retry_after(self):
+        responses = [_response(status=403, headers={"retry-after": "7"}), _response()]
+        with patch("klaus_kode.github._send", side_effect=responses), \
+             patch("klaus_kode.github.time.sleep") as sleep:
+            assert github._api("GET", "search/issues").ok
+        sleep.assert_called_once_with(7.0)
+
+    def test_permission_403_is_not_retried(self):
+        with patch("klaus_kode.github._send", return_value=_response(status=403)) as send, \
+             patch("klaus_kode.github.time.sleep") as sleep:
+            assert github._api("POST", "repos/o/r/forks").status == 403
+        send.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_gives_up_after_max_attempts(self):
+        with patch("klaus_kode.github._send", return_value=_response(status=503)) as send, \
+             patch("klaus_kode.github.time.sleep"):
+            assert github._api("GET", "repos/o/r").status == 503
+        assert send.call_count == github._MAX_ATTEMPTS
+
+    def test_repeated_get_is_served_from_cache(self, monkeypatch):
+        conn = self._connection(body=b'{"number": 1}')
+        monkeypatch.setattr(github._connections, "conn", conn, raising=False)
+        first = github._api("GET", "repos/o/r/issues/1")
+        assert github._api("GET", "repos/o/r/issues/1") is first
+        conn.request.assert_called_once()
+
+    def test_write_invalidates_cached_gets_under_path(self, monkeypatch):
+        conn = self._connection()
+        monkeypatch.setattr(github._connections, "conn", conn, raising=False)
+        github._api("GET", "repos/o/r/forks")
+        github._api("POST", "repos/o/r/forks")
+        github._api("GET", "repos/o/r/forks")
+        assert conn.request.call_count == 3
+
+    def test_cache_skipped_at_debug_verbosity(self, monkeypatch, capsys):
+        conn = self._connection()
+        monkeypatch.setattr(github._connections, "conn", conn, raising=False)
+        github._api("GET", "repos/o/r", verbose=2)
+        github._api("GET", "repos/o/r", verbose=2)
+        assert conn.request.call_count == 2
+
+
+def _graphql_issue_node(**overrides):
+    node = {
+        "number": 7,
+        "title": "Crash on empty input",
+        "body": None,
+        "state": "OPEN",
+        "labels": {"nodes": [{"name": "bug"}]},
+        "assignees": {"nodes": []},
+        "timelineItems": {"nodes": [
+            {"source": {"number": 9, "title": "Fix crash", "state": "OPEN",
+                        "isDraft": True, "author": {"login": "alice"}}},
+            {"source": {"number": 3, "title": "Old attempt", "state": "CLOSED",
+                        "isDraft": False, "author": {"login": "bob"}}},
+            {},
+        ]},
+    }
+    node.update(overrides)
+    return node
+
+
+class TestIssueFromGraphql:
+    def test_parses_fields(self):
+        issue = github._issue_from_graphql(_graphql_issue_node())
+        assert issue.number == 7
+        assert issue.body == ""
+        assert issue.state == "open"
+        assert issue.labels == ["bug"]
+        assert issue.assignees == []
+
+    def test_keeps_only_open_linked_prs(self):
+        issue = github._issue_from_graphql(_graphql_issue_node())
+        assert [pr["number"] for pr in issue.linked_prs] == [9]
+
+
+class TestCheckIssueActiveWork:
+    def test_prefetched_issue_makes_no_gh_calls(self):
+        issue = github._issue_from_graphql(_graphql_issue_node())
+        with patch("klaus_kode.github._api") as api:
+            is_active, reason = github.check_issue_active_work("o/r", issue)
+        api.assert_not_called()
+        assert is_active is True
+        assert "Draft PR #9 by alice" in reason
+
+    def test_unclaimed_issue_is_not_active(self):
+        issue = github._issue_from_graphql(_graphql_issue_node(timelineItems={"nodes": []}))
+        with patch("klaus_kode.github._api"):
+            assert github.check_issue_active_work("o/r", issue) == (False, "")
+
+    @pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=1)])
+    def test_unprefetched_issue_runs_both_lookups(self, executor):
+        issue = github.Issue(7, "a", "", [])
+        responses = {
+            "repos/o/r/issues/7": _response({"assignees": [{"login": "erin"}]}),
+            "search/issues": _response({"items": [
+                {"number": 9, "title": "Fix", "draft": False, "user": {"login": "frank"}},
+            ]}),
+        }
+        with patch("klaus_kode.github._api", side_effect=lambda method, path, *a, **k: responses[path]):
+            is_active, reason = github.check_issue_active_work("o/r", issue, executor)
+        assert is_active is True
+        assert "assigned to: erin" in reason
+        assert "PR #9 by frank" in reason
+
+    def test_assignee_and_wip_label_reported(self):
+        issue = github._issue_from_graphql(_graphql_issue_node(
+            assignees={"nodes": [{"login": "carol"}]},
+            labels={"nodes": [{"name": "WIP"}]},
+            timelineItems={"nodes": []},
+        ))
+        is_active, reason = github.check_issue_active_work("o/r", issue)
+        assert is_active is True
+        assert "assigned to: carol" in reason
+        assert "has label: 'WIP'" in reason
+
+
+class TestBulkActiveWork:
+    def test_fills_issues_from_aliased_response(self):
+        issues = [github.Issue(7, "a", "", []), github.Issue(8, "b", "", [])]
+        payload = {"data": {"repository": {
+            "i7": _graphql_issue_node(assignees={"nodes": [{"login": "dave"}]}),
+            "i8": None,
+        }}}
+        with patch("klaus_kode.github._api", return_value=_response(payload)) as api:
+            github.bulk_active_work("o/r", issues)
+        api.assert_called_once()
+        assert issues[0].assignees == ["dave"]
+        assert [pr["number"] for pr in issues[0].linked_prs] == [9]
+        # Missing from the response — left for the REST fallback
+        assert issues[1].assignees is None
+        assert issues[1].linked_prs is None
+
+    def test_skips_request_when_all_prefetched(self):
+        issue = github._issue_from_graphql(_graphql_issue_node())
+        with patch("klaus_kode.github._api") as api:
+            github.bulk_active_work("o/r", [issue])
+        api.assert_not_called()
+
+
+class TestAuthProbe:
+    def _probe(self, monkeypatch, data=None, status=200, headers=None):
+        monkeypatch.setenv("GH_TOKEN", "x")
+        monkeypatch.setattr(github, "_auth_probe_result", None)
+        return patch("klaus_kode.github._api", return_value=_response({"data": data}, status, headers))
+
+    def test_classic_token_needs_one_call(self, monkeypatch):
+        data = {"viewer": {"login": "me", "repositories": {"totalCount": 1}}, "repository": {"id": "R"}}
+        headers = {"x-oauth-scopes": "public_repo, read:org"}
+        with self._probe(monkeypatch, data, headers=headers) as api:
+            assert github.check_gh_auth() is True
+            scopes = github.check_token_scopes()
+        api.assert_called_once()
+        assert scopes["can_fork"] is True
+        assert scopes["can_create_prs"] is True
+
+    def test_fine_grained_token_reads_capabilities_from_query(self, monkeypatch):
+        data = {"viewer": {"login": "me", "repositories": None}, "repository": {"id": "R"}}
+        with self._probe(monkeypatch, data) as api:
+            scopes = github.check_token_scopes()
+        api.assert_called_once()
+        assert scopes["can_read_repos"] is True
+        assert scopes["can_fork"] is False
+
+    def test_failed_auth_reports_nothing(self, monkeypatch):
+        with self._probe(monkeypatch, status=401) as api:
+            assert github.check_gh_auth() is False
+            assert github.check_token_scopes()["authenticated"] is False
+        api.assert_called_once()
+
+
+class TestSearchIssues:
+    def test_query_fits_length_limit(self):
+        query, excluded = github._issue_search_query("some-owner/some-repo")
+        assert len(query) <= github._MAX_SEARCH_QUERY
+        assert excluded <= github.NON_CODING_LABELS
+        for label in excluded:
+            assert label in query
+
+    def test_filters_labels_not_excluded_by_query(self):
+        _, excluded = github._issue_search_query("o/r")
+        leftover = sorted(github.NON_CODING_LABELS - excluded)[0]
+        items = [
+            {"number": 1, "title": "ok", "body": None, "labels": [{"name": "bug"}], "state": "open"},
+            {"number": 2, "title": "skip", "body": "", "labels": [{"name": leftover.title()}], "state": "open"},
+        ]
+        with patch("klaus_kode.github._api", return_value=_response({"items": items})) as api:
+            issues = github._search_issues_rest("o/r", 30)
+        assert [i.number for i in issues] == [1]
+        assert api.call_args.args[:2] == ("GET", "search/issues")
+
+    def test_graphql_listing_includes_active_work(self):
+        nodes = [
+            _graphql_issue_node(),
+            _graphql_issue_node(number=8, labels={"nodes": [{"name": "Question"}]}),
+        ]
+        payload = {"data": {"repository": {"issues": {"nodes": nodes}}}}
+        with patch("klaus_kode.github._api", return_value=_response(payload)) as api:
+            issues = github.search_issues("o/r")
+        api.assert_called_once()
+        assert [i.number for i in issues] == [7]
+        assert [pr["number"] for pr in issues[0].linked_prs] == [9]
+
+    def test_cached_listing_drops_active_work(self):
+        payload = {"data": {"repository": {"issues": {"nodes": [_graphql_issue_node()]}}}}
+        with patch("klaus_kode.github._api", return_value=_response(payload)) as api:
+            fresh = github.search_issues("o/r")
+            cached = github.search_issues("o/r")
+        api.assert_called_once()
+        assert fresh[0].linked_prs is not None
+        assert (cached[0].assignees, cached[0].linked_prs) == (None, None)
+
+    def test_graphql_error_falls_back_to_rest(self):
+        responses = [
+            _response({"errors": [{"message": "boom"}]}),
+            _response({"items": [{"number": 1, "title": "ok", "labels": [], "state": "open"}]}),
+        ]
+        with patch("klaus_kode.github._api", side_effect=responses) as api:
+            issues = github.search_issues("o/r")
+        assert [i.number for i in issues] == [1]
+        assert issues[0].assignees is None
+        assert api.call_args.args[:2] == ("GET", "search/issues")
+
+
+class TestForkRepo:
+    def test_polls_with_exponential_backoff(self):
+        with patch("klaus_kode.github._api", return_value=_response({"full_name": "me/r"})), \
+             patch("klaus_kode.github.validate_repo", side_effect=[False, False, False, True]), \
+             patch("klaus_kode.github.time.sleep") as sleep:
+            assert github.fork_repo("o/r") == "me/r"
+        assert [c.args[0] for c in sleep.call_args_list] == [0.25, 0.5, 1.0]
+
+    def test_gives_up_after_about_thirty_seconds(self):
+        with patch("klaus_kode.github._api", return_value=_response({"full_name": "me/r"})), \
+             patch("klaus_kode.github.validate_repo", return_value=False), \
+             patch("klaus_kode.github.time.sleep") as sleep, \
+             pytest.raises(SystemExit):
+            github.fork_repo("o/r")
+        assert 30 <= sum(c.args[0] for c in sleep.call_args_list) < 36
+
+
+class TestSearchRepos:
+    def test_strips_noise_words_from_query(self):
+        with patch("klaus_kode.github._api", return_value=_response({"items": []})) as api:
+            github.search_repos("Python Repositories for my-repo/parsing library")
+        assert api.call_args.args[2]["q"] == "Python for my-repo parsing stars:>10"
+
+    def test_keeps_description_if_only_noise(self):
+        with patch("klaus_kode.github._api", return_value=_response({"items": []})) as api:
+            github.search_repos("repo")
+        assert api.call_args.args[2]["q"] == "repo stars:>10"
+
+
+class TestFetchIssue:
+    def test_builds_issue_from_rest_response(self):
+        data = {"number": 5, "title": "t", "body": None, "state": "open",
+                "labels": [{"name": "bug"}], "assignees": [{"login": "gina"}]}
+        with patch("klaus_kode.github._api", return_value=_response(data)):
+            issue = github.fetch_issue("o/r", 5)
+        assert (issue.body, issue.labels, issue.assignees) == ("", ["bug"], ["gina"])
+        assert issue.linked_prs is None
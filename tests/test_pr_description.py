@@ -1,8 +1,12 @@
-"""Tests for klaus_kode.pr_description — _build_compare_url (pure function)."""
+"""Tests for klaus_kode.pr_description — pure helpers only."""
 
 from __future__ import annotations
 
-from klaus_kode.pr_description import _build_compare_url
+from unittest.mock import MagicMock, patch
+from urllib.parse import quote
+
+from klaus_kode.github import Issue
+from klaus_kode.pr_description import _build_compare_url, description_diff, generate_pr_description
 
 
 class TestBuildCompareUrl:
@@ -45,3 +49,51 @@ class TestBuildCompareUrl:
         assert "/pr.md" in body_note
         # URL should NOT contain the long body
         assert len(url) < 8500
+
+    def test_long_body_not_quoted(self):
+        with patch("klaus_kode.pr_description.quote", wraps=quote) as quote_spy:
+            _build_compare_url(
+                title="Fix",
+                body="x" * 9000,
+                repo="o/r",
+                head="f:b",
+                default_branch="main",
+                pr_file="/pr.md",
+            )
+        assert all(len(c.args[0]) < 9000 for c in quote_spy.call_args_list)
+
+    def test_body_that_grows_past_limit_when_quoted_is_dropped(self):
+        url, body_note = _build_compare_url(
+            title="Fix",
+            body=" " * 5000,
+            repo="o/r",
+            head="f:b",
+            default_branch="main",
+            pr_file="/pr.md",
+        )
+        assert "body=" not in url
+        assert body_note != ""
+
+
+class TestDescriptionDiff:
+    def test_captured_diff_within_budget_is_used_as_is(self):
+        with patch("klaus_kode.pr_description.compact_diff") as mock_compact:
+            assert description_diff("main", "diff --git a/x b/x\n") == "diff --git a/x b/x\n"
+        mock_compact.assert_not_called()
+
+    def test_oversized_diff_is_rebuilt_from_whole_files(self):
+        with patch("klaus_kode.pr_description.compact_diff", return_value="compact") as mock_compact:
+            assert description_diff("main", "x" * 20_000) == "compact"
+        mock_compact.assert_called_once_with("main", max_bytes=16_000)
+
+
+class TestGeneratePrDescription:
+    def test_given_diff_used_as_is(self):
+        issue = Issue(number=3, title="Fix", body="", labels=[])
+        big = "+" * 20_000
+        with patch("klaus_kode.pr_description.compact_diff") as mock_compact, \
+             patch("klaus_kode.pr_description._quick_claude", new_callable=MagicMock) as mock_claude, \
+             patch("klaus_kode.pr_description.run_sync", return_value='{"title": "T", "body": "B"}'):
+            assert generate_pr_description(issue, "o/r", "main", diff_output=big) == ("T", "B")
+        mock_compact.assert_not_called()
+        assert big in mock_claude.call_args.args[0]
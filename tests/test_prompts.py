@@ -50,6 +50,12 @@ class TestBuildWorkPrompt:
         result = build_work_prompt(issue, "owner/repo", "", repo_context="")
         assert "Repository context" not in result
 
+    def test_issue_comes_after_repo_sections(self):
+        issue = _make_issue()
+        result = build_work_prompt(issue, "owner/repo", "Please run black", repo_context="tree")
+        assert result.index("Please run black") < result.index("tree") < result.index("Bug description")
+
+
 
 class TestBuildReviewPrompt:
     def test_with_diff_includes_it(self):
@@ -57,6 +63,11 @@ class TestBuildReviewPrompt:
         assert "diff here" in result
         assert "```" in result
 
+    def test_verdict_reminder_follows_diff(self):
+        result = build_review_prompt("main", diff_output="diff here")
+        assert result.rstrip().endswith("APPROVED or REJECTED: <reason>.")
+        assert result.index("diff here") < result.rindex("APPROVED")
+
     def test_without_diff_includes_git_instruction(self):
         result = build_review_prompt("main")
         assert "git diff upstream/main" in result
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import io
 import os
+import subprocess
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 import klaus_kode.repo_ops as repo_ops
 
 
@@ -19,6 +23,41 @@ class TestReadContributingGuidelines:
         assert result == ""
 
 
+    def test_reads_github_dir_in_candidate_order(self, tmp_workspace):
+        (tmp_workspace / ".github").mkdir()
+        (tmp_workspace / ".github" / "CONTRIBUTING.md").write_text("nested")
+        (tmp_workspace / "CONTRIBUTING.rst").write_text("top")
+        result = repo_ops.read_contributing_guidelines()
+        assert result.index("CONTRIBUTING.rst") < result.index(".github/CONTRIBUTING.md")
+
+
+    def test_long_file_capped_at_line_boundary(self, tmp_workspace):
+        (tmp_workspace / "CONTRIBUTING.md").write_text(("x" * 99 + "\n") * 200)
+        result = repo_ops.read_contributing_guidelines()
+        body = result.split("---\n", 1)[1]
+        assert len(body) <= repo_ops._GUIDELINES_MAX_CHARS + 1
+        assert body.endswith("x\n\n")
+
+
+class TestReadHead:
+    def test_short_file_returned_whole(self, tmp_workspace):
+        (tmp_workspace / "f").write_text("a\nb")
+        assert repo_ops._read_head(str(tmp_workspace / "f"), 10) == "a\nb"
+
+    def test_single_long_line_cut_at_limit(self, tmp_workspace):
+        (tmp_workspace / "f").write_text("x" * 50)
+        assert repo_ops._read_head(str(tmp_workspace / "f"), 10) == "x" * 10
+
+
+class TestExistingFiles:
+    def test_keeps_candidate_order_and_skips_dirs(self, tmp_workspace):
+        (tmp_workspace / "setup.py").write_text("")
+        (tmp_workspace / "pyproject.toml").write_text("")
+        (tmp_workspace / "go.mod").mkdir()
+        found = repo_ops._existing_files(str(tmp_workspace), ["go.mod", "pyproject.toml", "setup.py", "x/y"])
+        assert found == ["pyproject.toml", "setup.py"]
+
+
 class TestWriteInnerClaudeMd:
     def test_creates_claude_md(self, tmp_workspace, mock_issue):
         repo_ops.write_inner_claude_md(mock_issue, "owner/repo", "guidelines", "fix/issue-42")
@@ -45,17 +84,80 @@ class TestCleanupInnerClaudeMd:
 class TestGatherRepoContext:
     def test_reads_readme(self, tmp_workspace):
         (tmp_workspace / "README.md").write_text("# My Project\nSome description.")
+        result = repo_ops.gather_repo_context()
+        assert "My Project" in result
+        assert "./README.md" in result
 
-        # Mock subprocess.run for the `find` call
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "./README.md\n./src/main.py\n"
+    def test_lists_two_levels_and_skips_vendor_dirs(self, tmp_workspace):
+        for rel in ("setup.py", "src/main.py", "src/pkg/deep.py", "node_modules/x.js"):
+            (tmp_workspace / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_workspace / rel).write_text("")
+        files = repo_ops._list_files(str(tmp_workspace), 200)
+        assert files == ["./setup.py", "./src/main.py"]
 
-        with patch("klaus_kode.repo_ops.subprocess.run", return_value=mock_result):
-            result = repo_ops.gather_repo_context()
+    def test_listing_stops_past_limit(self, tmp_workspace):
+        for i in range(10):
+            (tmp_workspace / f"f{i}.txt").write_text("")
+        assert len(repo_ops._list_files(str(tmp_workspace), 3)) == 4
+        result = repo_ops.gather_repo_context()
+        assert "10 files" in result
 
-        assert "My Project" in result
-        assert "README.md" in result
+    def test_memoized_per_head_commit(self, tmp_workspace):
+        (tmp_workspace / ".git" / "HEAD").write_text("abc123\n")
+        with patch("klaus_kode.repo_ops._list_files", return_value=[]) as list_files:
+            first = repo_ops.gather_repo_context()
+            assert repo_ops.gather_repo_context() == first
+            assert list_files.call_count == 1
+            repo_ops.cleanup_inner_claude_md()
+            repo_ops.gather_repo_context()
+            assert list_files.call_count == 2
+
+
+class TestStripCoauthorTrailers:
+    def _git(self, repo, *args):
+        return subprocess.run(
+            ["git", *args], cwd=repo, check=True, capture_output=True, text=True,
+        ).stdout
+
+    def test_rewrites_only_from_first_affected_commit(self, tmp_path, monkeypatch):
+        for var, value in {"GIT_AUTHOR_NAME": "a", "GIT_AUTHOR_EMAIL": "a@x",
+                           "GIT_COMMITTER_NAME": "a", "GIT_COMMITTER_EMAIL": "a@x"}.items():
+            monkeypatch.setenv(var, value)
+        repo = tmp_path / "r"
+        repo.mkdir()
+        self._git(repo, "init", "-q", "-b", "main")
+        self._git(repo, "commit", "-q", "--allow-empty", "-m", "base")
+        self._git(repo, "update-ref", "refs/remotes/upstream/main", "HEAD")
+        self._git(repo, "commit", "-q", "--allow-empty", "-m", "clean")
+        clean_sha = self._git(repo, "rev-parse", "HEAD").strip()
+        (repo / "f.txt").write_text("x")
+        self._git(repo, "add", "f.txt")
+        self._git(repo, "commit", "-q", "-m", "fix\n\nCo-Authored-By: Claude <c@x>")
+        self._git(repo, "commit", "-q", "--allow-empty", "-m", "after")
+        monkeypatch.setattr(repo_ops, "REPO_PATH", str(repo))
+
+        repo_ops._strip_coauthor_trailers("main")
+
+        log = self._git(repo, "log", "--format=%H %B", "upstream/main..HEAD")
+        assert "Co-Authored-By" not in log
+        assert self._git(repo, "rev-parse", "HEAD~2").strip() == clean_sha
+        assert self._git(repo, "log", "-1", "--format=%s", "HEAD~1").strip() == "fix"
+        assert (repo / "f.txt").read_text() == "x"
+        assert self._git(repo, "status", "--porcelain") == ""
+
+
+class TestHeadCommit:
+    def test_resolves_loose_and_packed_refs(self, tmp_workspace):
+        git_dir = tmp_workspace / ".git"
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "packed-refs").write_text("# pack-refs\nfeed01 refs/heads/main\n")
+        assert repo_ops._head_commit(str(tmp_workspace)) == "feed01"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "refs" / "heads" / "main").write_text("beef02\n")
+        assert repo_ops._head_commit(str(tmp_workspace)) == "beef02"
+
+    def test_unresolvable_head(self, tmp_workspace):
+        assert repo_ops._head_commit(str(tmp_workspace)) is None
 
 
 class TestCommitChanges:
@@ -95,3 +197,191 @@ class TestCommitChanges:
             has_changes = repo_ops.commit_changes(42, "main")
 
         assert has_changes is True
+
+    def _commit_calls(self, status: str) -> list[list[str]]:
+        calls = []
+
+        def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return MagicMock(returncode=0, stdout=status if "status" in cmd else "", stderr="")
+
+        with patch("klaus_kode.repo_ops.subprocess.run", side_effect=mock_run):
+            assert repo_ops.commit_changes(42, "main") is True
+        return calls[1:]
+
+    def test_modified_only_commits_in_one_call(self, tmp_workspace):
+        calls = self._commit_calls("1 .M N... 100644 100644 100644 a1 a1 a.py\n"
+                                   "1 .D N... 100644 100644 000000 b1 b1 b.py\n")
+        assert calls == [["git", "commit", "-a", "-m", "fix: address issue #42"]]
+
+    def test_untracked_files_are_added_first(self, tmp_workspace):
+        calls = self._commit_calls("1 .M N... 100644 100644 100644 a1 a1 a.py\n? new.py\n")
+        assert calls == [["git", "add", "-A"], ["git", "commit", "-m", "fix: address issue #42"]]
+
+    def test_clean_tracking_branch_needs_one_git_call(self, tmp_workspace):
+        status = ("# branch.oid abc\n# branch.head fix/issue-42\n"
+                  "# branch.upstream upstream/main\n# branch.ab +2 -0\n")
+        calls = []
+
+        def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return MagicMock(returncode=0, stdout=status, stderr="")
+
+        with patch("klaus_kode.repo_ops.subprocess.run", side_effect=mock_run), \
+                patch("klaus_kode.repo_ops._strip_coauthor_trailers"):
+            assert repo_ops.commit_changes(42, "main") is True
+        assert calls == [["git", "status", "--porcelain=v2", "--branch"]]
+
+
+class TestParseStatus:
+    def test_ahead_only_counted_for_matching_upstream(self):
+        out = "# branch.upstream upstream/main\n# branch.ab +0 -3\n? x\n"
+        assert repo_ops._parse_status(out, "upstream/main") == (["? x"], 0)
+        assert repo_ops._parse_status(out, "upstream/dev") == (["? x"], None)
+        assert repo_ops._parse_status("# branch.head b\n", "upstream/main") == ([], None)
+
+
+class TestCommitChangesReturnDiff:
+    def test_clean_tree_uses_diff_instead_of_log(self, tmp_workspace):
+        calls = []
+
+        def mock_run(cmd, **kwargs):
+            calls.append(cmd)
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with patch("klaus_kode.repo_ops.subprocess.run", side_effect=mock_run), \
+                patch("klaus_kode.repo_ops.capture_diff", return_value="+fix\n"), \
+                patch("klaus_kode.repo_ops._strip_coauthor_trailers") as strip:
+            assert repo_ops.commit_changes(42, "main", return_diff=True) == (True, "+fix\n")
+        assert not any("log" in cmd for cmd in calls)
+        strip.assert_called_once_with("main")
+
+    def test_no_changes_returns_empty_diff(self, tmp_workspace):
+        with patch("klaus_kode.repo_ops.subprocess.run",
+                   return_value=MagicMock(returncode=0, stdout="", stderr="")), \
+                patch("klaus_kode.repo_ops.capture_diff", return_value=""):
+            assert repo_ops.commit_changes(42, "main", return_diff=True) == (False, "")
+
+
+class TestCaptureDiff:
+    def _popen(self, data: bytes):
+        proc = MagicMock()
+        proc.stdout = io.BytesIO(data)
+        return patch("klaus_kode.repo_ops.subprocess.Popen", return_value=proc)
+
+    def test_small_diff_returned_whole(self, tmp_workspace):
+        with self._popen(b"diff --git a/x b/x\n+hello\n"):
+            assert repo_ops.capture_diff("main") == "diff --git a/x b/x\n+hello\n"
+
+    def test_large_diff_truncated_in_one_git_call(self, tmp_workspace):
+        with self._popen(b"+" * 100) as popen, \
+                patch("klaus_kode.repo_ops.subprocess.run") as run:
+            diff = repo_ops.capture_diff("main", max_bytes=10)
+        assert diff == "+" * 10 + "\n... (diff truncated at 10 bytes)\n"
+        assert "--patch-with-stat" in popen.call_args.args[0]
+        run.assert_not_called()
+
+    def test_echo_streams_whole_diff_but_keeps_cap(self, tmp_workspace, capsysbinary):
+        with self._popen(b"+" * 100):
+            diff = repo_ops.capture_diff("main", max_bytes=10, echo=True)
+        assert capsysbinary.readouterr().out == b"+" * 100
+        assert diff.startswith("+" * 10 + "\n")
+
+
+class TestCompactDiff:
+    def _git(self, files: dict[str, str]):
+        def run(cmd, **kwargs):
+            out = " summary\n\n" + "".join(
+                f"diff --git a/{name} b/{name}\n{body}" for name, body in files.items()
+            )
+            return MagicMock(returncode=0, stdout=out)
+        return patch("klaus_kode.repo_ops.subprocess.run", side_effect=run)
+
+    def test_keeps_whole_files_within_budget(self, tmp_workspace):
+        files = {"a.py": "+a\n", "big.py": "+" * 100 + "\n", "c.py": "+c\n"}
+        with self._git(files):
+            diff = repo_ops.compact_diff("main", max_bytes=100)
+        assert diff.startswith(" summary\n")
+        assert "+a\n" in diff and "+c\n" in diff
+        assert "+" * 100 not in diff
+        assert diff.endswith("(diff omitted for big.py)\n")
+
+    @pytest.mark.parametrize("section, name", [
+        ("diff --git a/x.py b/x.py\n+x\n", "x.py"),
+        ("diff --git a/my file b/my file\nnew file mode 100644\n", "my file"),
+        ("diff --git a/old b/new\nsimilarity index 90%\nrename from old\nrename to new\n", "new"),
+        ('diff --git "a/t\\tab" "b/t\\tab"\nBinary files differ\n', "t\\tab"),
+    ])
+    def test_file_name_from_header(self, section, name):
+        assert repo_ops._diff_file_name(section) == name
+
+    @pytest.mark.parametrize("max_bytes", [40, 60, 80, 100])
+    def test_whole_result_within_budget(self, tmp_workspace, max_bytes):
+        files = {"a.py": "+a\n", "big.py": "+" * 100 + "\n", "c.py": "+c\n"}
+        with self._git(files):
+            diff = repo_ops.compact_diff("main", max_bytes=max_bytes)
+        assert len(diff.encode()) <= max_bytes
+
+    def test_oversized_stat_clipped_to_whole_lines(self, tmp_workspace):
+        with patch("klaus_kode.repo_ops.subprocess.run", return_value=MagicMock(
+            returncode=0, stdout=" a | 1 +\n" * 20 + "\n",
+        )):
+            diff = repo_ops.compact_diff("main", max_bytes=50)
+        assert diff == " a | 1 +\n" * 5
+
+    def test_single_diff_process_for_all_files(self, tmp_workspace):
+        files = {f"f{i}.py": f"+{i}\n" for i in range(5)}
+        with self._git(files) as run:
+            diff = repo_ops.compact_diff("main")
+        assert run.call_count == 1
+        assert run.call_args.kwargs["errors"] == "replace"
+        assert all(f"+{i}\n" in diff for i in range(5))
+
+
+class TestConfigureGit:
+    def test_appends_to_existing_environment_config(self, monkeypatch):
+        env = {"GIT_CONFIG_COUNT": "1", "GIT_CONFIG_KEY_0": "a.b", "GIT_CONFIG_VALUE_0": "c"}
+        monkeypatch.setattr(repo_ops.os, "environ", env)
+        repo_ops._configure_git()
+        assert env["GIT_CONFIG_COUNT"] == str(1 + len(repo_ops._GIT_CONFIG))
+        assert env["GIT_CONFIG_KEY_0"] == "a.b"
+        assert env["GIT_CONFIG_KEY_1"] == "user.name"
+        assert env["GIT_CONFIG_VALUE_3"] == "cat"
+
+    def test_second_call_adds_nothing(self, monkeypatch):
+        env = {}
+        monkeypatch.setattr(repo_ops.os, "environ", env)
+        repo_ops._configure_git()
+        first = dict(env)
+        repo_ops._configure_git()
+        assert env == first
+        assert env["GIT_CONFIG_COUNT"] == str(len(repo_ops._GIT_CONFIG))
+
+    def test_logged_as_decision(self, monkeypatch):
+        monkeypatch.setattr(repo_ops.os, "environ", {})
+        logger = MagicMock()
+        repo_ops._configure_git(logger)
+        logger.log_subprocess.assert_not_called()
+        assert logger.log_decision.call_args.kwargs["config"] == repo_ops._GIT_CONFIG
+
+
+class TestHeadBranch:
+    def test_reads_symbolic_ref(self, tmp_workspace):
+        (tmp_workspace / ".git" / "HEAD").write_text("ref: refs/heads/develop\n")
+        assert repo_ops._head_branch(str(tmp_workspace)) == "develop"
+
+    def test_detached_or_missing_head(self, tmp_workspace):
+        assert repo_ops._head_branch(str(tmp_workspace)) is None
+        (tmp_workspace / ".git" / "HEAD").write_text("0123abcd\n")
+        assert repo_ops._head_branch(str(tmp_workspace)) is None
+
+
+class TestMirrorPath:
+    def test_under_cache_dir_when_enabled(self, monkeypatch):
+        monkeypatch.setenv("KLAUS_KODE_CLONE_CACHE", "1")
+        path = repo_ops._mirror_path("owner/repo")
+        assert path == os.path.join(repo_ops.cache.CACHE_DIR, "repos", "owner__repo")
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("KLAUS_KODE_CLONE_CACHE", raising=False)
+        assert repo_ops._mirror_path("owner/repo") is None
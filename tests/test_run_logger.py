@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import os
 
-from klaus_kode.run_logger import RunLogger
+from klaus_kode.run_logger import RunLogger, iter_entries
 
 
 def _read_entries(log_path: str) -> list[dict]:
     """Read all JSON lines from a log file."""
-    with open(log_path) as f:
-        return [json.loads(line) for line in f if line.strip()]
+    return list(iter_entries(log_path))
 
 
 class TestRunLogger:
@@ -26,7 +24,9 @@ class TestRunLogger:
         logger.log_run_start({"repo": "a/b"})
         logger.flush_final_summary()
         entries = _read_entries(logger._log_path)
-        assert any(e["type"] == "run_start" for e in entries)
+        start = next(e for e in entries if e["type"] == "run_start")
+        assert start["start_iso"] == logger._start_iso
+        assert all("timestamp" not in e for e in entries)
 
     def test_log_step_start_and_end(self, tmp_path):
         logger = RunLogger(log_dir=str(tmp_path))
@@ -59,6 +59,15 @@ class TestRunLogger:
         assert tr["tool_output"] == "file content"
         assert tr["is_error"] is False
 
+    def test_long_tool_result_keeps_head_and_tail(self, tmp_path):
+        logger = RunLogger(log_dir=str(tmp_path))
+        logger.log_tool_result("t1", "Bash", "h" * 5000 + "m" * 10_000 + "t" * 5000)
+        logger.flush_final_summary()
+        entries = _read_entries(logger._log_path)
+        out = next(e for e in entries if e["type"] == "tool_result")["tool_output"]
+        assert out.startswith("h" * 4096) and out.endswith("t" * 4096)
+        assert "[11808 chars elided]" in out
+
     def test_log_error(self, tmp_path):
         logger = RunLogger(log_dir=str(tmp_path))
         logger.log_error("something went wrong")
@@ -67,6 +76,24 @@ class TestRunLogger:
         err = next(e for e in entries if e["type"] == "error")
         assert err["error"] == "something went wrong"
 
+    def test_log_subprocess_caps_and_decodes_bytes(self, tmp_path):
+        logger = RunLogger(log_dir=str(tmp_path))
+        logger.log_subprocess(["git", "log"], 0, b"x" * 20_000, "err")
+        logger.flush_final_summary()
+        entries = _read_entries(logger._log_path)
+        sp = next(e for e in entries if e["type"] == "subprocess")
+        assert sp["cmd"] == "git log"
+        assert sp["stdout"] == "x" * 10 * 1024
+        assert sp["stderr"] == "err"
+
+    def test_lines_are_compact(self, tmp_path):
+        logger = RunLogger(log_dir=str(tmp_path))
+        logger.log_decision("skip", "busy", issue=3)
+        logger.flush_final_summary()
+        with open(logger._log_path) as f:
+            line = f.readline()
+        assert ", " not in line and '": ' not in line
+
     def test_log_run_end_includes_duration(self, tmp_path):
         logger = RunLogger(log_dir=str(tmp_path))
         logger.log_run_end(exit_code=0)
@@ -75,6 +102,30 @@ class TestRunLogger:
         end = next(e for e in entries if e["type"] == "run_end")
         assert "total_duration_s" in end
 
+    def test_flush_writes_queued_entries_in_order(self, tmp_path):
+        logger = RunLogger(log_dir=str(tmp_path))
+        for i in range(50):
+            logger.log_text_block(f"block {i}")
+        logger.flush_final_summary()
+        assert not logger._writer.is_alive()
+        texts = [e["text"] for e in _read_entries(logger._log_path) if e["type"] == "text_block"]
+        assert texts == [f"block {i}" for i in range(50)]
+
+    def test_flush_waits_for_writer(self, tmp_path):
+        logger = RunLogger(log_dir=str(tmp_path))
+        logger.log_error("boom")
+        logger.flush()
+        entries = _read_entries(logger._log_path)
+        assert entries[-1]["error"] == "boom"
+        logger.flush_final_summary()
+
+    def test_entries_not_held_in_memory_when_file_written(self, tmp_path):
+        logger = RunLogger(log_dir=str(tmp_path))
+        logger.log_text_block("hello")
+        assert logger._entries == []
+        logger.flush_final_summary()
+        assert _read_entries(logger._log_path)[-1]["text"] == "hello"
+
     def test_flush_dumps_to_stdout_when_no_file(self, tmp_path, capsys):
         # Create logger with a read-only dir to force _file=None
         readonly_dir = str(tmp_path / "nonexistent" / "deep" / "path")
@@ -95,3 +146,10 @@ class TestRunLogger:
         captured = capsys.readouterr().out
         assert "KLAUS_KODE_JSONL_START" in captured
         assert "test error" in captured
+
+
+class TestIterEntries:
+    def test_skips_blank_lines(self, tmp_path):
+        path = tmp_path / "run.jsonl"
+        path.write_text('{"type":"a"}\n\n  {"type":"b","n":[1,2]}\n')
+        assert list(iter_entries(str(path))) == [{"type": "a"}, {"type": "b", "n": [1, 2]}]
@@ -5,7 +5,21 @@ from __future__ import annotations
 import json
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
 from klaus_kode.github import Issue, Repository
+from klaus_kode.selection import (
+    _ask_claude,
+    _description_key,
+    _heuristic_branch_name,
+    _heuristic_compliance,
+    _relevant_guidelines,
+    check_guidelines_compliance,
+    parallel_pre_work,
+    pick_issue,
+    pick_repo,
+    suggest_branch_name,
+)
 
 
 def _make_issues():
@@ -16,6 +30,10 @@ def _make_issues():
     ]
 
 
+# Long and free of red flags, so the compliance check goes to Claude
+_LONG_GUIDELINES = "Follow PEP 8 and add tests for new code.\n" * 20
+
+
 def _make_repos():
     return [
         Repository("org/alpha", "Alpha project", "Python", 50, 5, ["web"]),
@@ -25,7 +43,6 @@ def _make_repos():
 
 class TestPickIssue:
     def test_valid_response_returns_matching_issue(self):
-        from klaus_kode.selection import pick_issue
         issues = _make_issues()
         # Mock _quick_claude to return JSON selecting issue #2
         mock_coro = AsyncMock(return_value=json.dumps({"issue_number": 2}))
@@ -34,17 +51,92 @@ class TestPickIssue:
         assert result.number == 2
 
     def test_exception_falls_back_to_first(self):
-        from klaus_kode.selection import pick_issue
         issues = _make_issues()
         mock_coro = AsyncMock(side_effect=Exception("API error"))
         with patch("klaus_kode.selection._quick_claude", mock_coro):
             result = pick_issue(issues, "anything")
         assert result.number == 1
 
+    def test_prompt_lists_issues_one_per_line(self):
+        issues = _make_issues()
+        issues[0].body = "line one\r\nline\ttwo"
+        mock_coro = AsyncMock(return_value=json.dumps({"issue_number": 1}))
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            pick_issue(issues, "anything")
+        prompt = mock_coro.call_args.args[0]
+        assert "1. Easy bug [bug] \u2014 line one  line two\n2. Hard feature" in prompt
+
+
+class TestAskClaudeCache:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("KLAUS_KODE_LLM_CACHE", raising=False)
+        mock_coro = AsyncMock(return_value=json.dumps({"issue_number": 2}))
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            pick_issue(_make_issues(), "hard feature")
+            pick_issue(_make_issues(), "hard feature")
+        assert mock_coro.call_count == 2
+
+    def test_repeat_prompt_served_from_cache(self, monkeypatch):
+        monkeypatch.setenv("KLAUS_KODE_LLM_CACHE", "1")
+        mock_coro = AsyncMock(return_value=json.dumps({"issue_number": 2}))
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            assert pick_issue(_make_issues(), "hard feature").number == 2
+            assert pick_issue(_make_issues(), "hard feature").number == 2
+            pick_issue(_make_issues(), "docs")
+        assert mock_coro.call_count == 2
+
+    def test_reworded_description_reuses_pick(self, monkeypatch):
+        monkeypatch.setenv("KLAUS_KODE_LLM_CACHE", "1")
+        mock_coro = AsyncMock(return_value=json.dumps({"issue_number": 2}))
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            assert pick_issue(_make_issues(), "Hard features").number == 2
+            assert pick_issue(_make_issues(), "feature, hard").number == 2
+            pick_issue(_make_issues()[1:], "hard feature")
+        assert mock_coro.call_count == 2
+
+    def test_description_key(self):
+        assert _description_key("Easy bugs!") == _description_key("bug  easy") == "bug easy"
+        assert _description_key("CSS class") == "class css"
+
+    def test_malformed_answer_not_cached(self, monkeypatch):
+        monkeypatch.setenv("KLAUS_KODE_LLM_CACHE", "1")
+        mock_coro = AsyncMock(return_value="not json")
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            _ask_claude("q", {})
+            _ask_claude("q", {})
+        assert mock_coro.call_count == 2
+
+
+class TestRelevantGuidelines:
+    def test_keeps_intro_and_matching_sections(self):
+        text = (
+            "\n--- CONTRIBUTING.md ---\nWelcome!\n"
+            "## Code of Conduct\nBe kind.\n"
+            "## Branch naming\nUse feat/x.\n"
+            "### Building the docs\nRun make.\n"
+            "## Contributor License Agreement (CLA)\nSign it.\n"
+        )
+        result = _relevant_guidelines(text)
+        assert "Welcome!" in result and "Use feat/x." in result and "Sign it." in result
+        assert "Be kind." not in result and "Run make." not in result
+
+    def test_keeps_red_flag_under_unrelated_heading(self):
+        text = (
+            "## Code of Conduct\nBe kind.\n"
+            "## Our policy\nWe do not accept pull requests generated by AI tools or bots.\n"
+            "## Branch naming\nUse feat/x.\n"
+        )
+        result = _relevant_guidelines(text)
+        assert "generated by AI tools or bots" in result
+        assert "Be kind." not in result
+
+    def test_no_matching_heading_keeps_everything(self):
+        text = "## Setup\nInstall.\n## Style\nBlack.\n"
+        assert _relevant_guidelines(text) == text
+
 
 class TestPickRepo:
     def test_valid_response_returns_matching_repo(self):
-        from klaus_kode.selection import pick_repo
         repos = _make_repos()
         # Index is 1-based, so 2 means the second repo
         mock_coro = AsyncMock(return_value=json.dumps({"repo_index": 2}))
@@ -55,7 +147,92 @@ class TestPickRepo:
 
 class TestSuggestBranchName:
     def test_no_guidelines_returns_fallback(self):
-        from klaus_kode.selection import suggest_branch_name
         issue = Issue(number=42, title="Fix bug", body="desc", labels=[])
         result = suggest_branch_name(issue, "")
         assert result == "fix/issue-42"
+
+
+class TestParallelPreWork:
+    def test_single_call_returns_both_answers(self):
+        issue = Issue(number=42, title="Fix bug", body="desc", labels=[])
+        answer = {"branch_name": "bugfix/42-crash", "decision": "ABORT", "reason": "CLA"}
+        mock_coro = AsyncMock(return_value=json.dumps(answer))
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            result = parallel_pre_work(issue, _LONG_GUIDELINES)
+        assert result == ("bugfix/42-crash", False)
+        assert mock_coro.call_count == 1
+
+    def test_prompt_starts_with_guidelines(self):
+        issue = Issue(number=42, title="Fix bug", body="desc", labels=[])
+        mock_coro = AsyncMock(return_value="{}")
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            parallel_pre_work(issue, _LONG_GUIDELINES)
+            check_guidelines_compliance(_LONG_GUIDELINES)
+        prompts = [call.args[0] for call in mock_coro.call_args_list]
+        prefix = f"<contributing_guidelines>\n{_LONG_GUIDELINES}\n</contributing_guidelines>\n\n"
+        assert len(prompts) == 2
+        assert all(p.startswith(prefix) for p in prompts)
+
+    def test_invalid_branch_falls_back_but_keeps_decision(self):
+        issue = Issue(number=42, title="Fix bug", body="desc", labels=[])
+        answer = {"branch_name": "bad name!", "decision": "PROCEED", "reason": ""}
+        mock_coro = AsyncMock(return_value=json.dumps(answer))
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            assert parallel_pre_work(issue, _LONG_GUIDELINES) == ("fix/issue-42", True)
+
+    def test_failure_uses_defaults(self):
+        issue = Issue(number=42, title="Fix bug", body="desc", labels=[])
+        mock_coro = AsyncMock(side_effect=Exception("API error"))
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            assert parallel_pre_work(issue, _LONG_GUIDELINES) == ("fix/issue-42", True)
+
+
+class TestHeuristics:
+    def test_cla_aborts_without_claude(self):
+        issue = Issue(number=42, title="Fix bug", body="desc", labels=[])
+        mock_coro = AsyncMock()
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            assert parallel_pre_work(issue, _LONG_GUIDELINES + "Sign our CLA first.") == ("fix/issue-42", False)
+        mock_coro.assert_not_called()
+
+    def test_bot_ban_detected(self):
+        assert _heuristic_compliance("We do not accept pull requests from bots.") is False
+        assert _heuristic_compliance("AI-generated PRs will be closed.") is False
+        assert _heuristic_compliance("Bot PRs will be closed.") is False
+        assert _heuristic_compliance("Automated pull requests will be closed.") is False
+        assert _heuristic_compliance("You must sign the CLA before we can merge.") is False
+        assert _heuristic_compliance(
+            "We do not accept pull requests generated by AI tools or bots.",
+        ) is False
+
+    @pytest.mark.parametrize("text", [
+        "There are no automated tests yet",
+        "We have no automated CI",
+        "there is no bot that formats code",
+        "We do not require a CLA",
+        "No CLA is needed",
+        "No CLA is required.",
+        "Pull requests with failing automated tests will be closed.",
+        "We will not accept pull requests that break automated tests.",
+        "We cannot accept changes to automated release scripts.",
+    ])
+    def test_plain_mentions_defer_to_claude(self, text):
+        assert _heuristic_compliance(text) is None
+
+    def test_short_clean_guidelines_proceed(self):
+        issue = Issue(number=42, title="Fix bug", body="desc", labels=[])
+        guidelines = "Run the tests. Name branches like `fix/short-desc` or `feat/short-desc`."
+        mock_coro = AsyncMock()
+        with patch("klaus_kode.selection._quick_claude", mock_coro):
+            assert parallel_pre_work(issue, guidelines) == ("fix/issue-42", True)
+        mock_coro.assert_not_called()
+
+    def test_review_terms_defer_to_claude(self):
+        assert _heuristic_compliance("Please discuss changes in an issue first.") is None
+        assert _heuristic_compliance(_LONG_GUIDELINES) is None
+
+    def test_branch_name_needs_one_clear_prefix(self):
+        issue = Issue(number=7, title="t", body="", labels=[])
+        assert _heuristic_branch_name(issue, "Branch: 'feature/x' or 'docs/y'") is None
+        assert _heuristic_branch_name(issue, "Use branches named `feature/x`") == "feature/issue-7"
+        assert _heuristic_branch_name(issue, "Example: `feature/x`") is None
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import json
+from unittest.mock import patch
+
 from klaus_kode.tui import format_tool_input, print_tool_result_output, DIM, RESET
 
+_TEN_LINES = "\n".join(f"line {i}" for i in range(10))
+
 
 class TestFormatToolInput:
     def test_read_file_path(self):
@@ -53,11 +58,19 @@ class TestFormatToolInput:
         result = format_tool_input("Grep", {"pattern": "foo"})
         assert result == " \u2192 /foo/ in ."
 
+    def test_task_shows_json(self):
+        result = format_tool_input("Task", {"prompt": "do it"})
+        assert result == ' \u2192 {"prompt": "do it"}'
+
+    def test_task_long_prompt_truncated(self):
+        inp = {"description": "x", "prompt": "p\n" * 10_000}
+        result = format_tool_input("Task", inp)
+        assert result == " \u2192 " + json.dumps(inp)[:150]
+
 
 class TestPrintToolResultOutput:
     def test_verbosity_0_truncates_at_3_lines(self, capsys):
-        output = "\n".join(f"line {i}" for i in range(10))
-        print_tool_result_output(output, verbose=0)
+        print_tool_result_output(_TEN_LINES, verbose=0)
         captured = capsys.readouterr().out
         lines = [l for l in captured.strip().splitlines() if l.strip()]
         # 3 content lines + 1 "... (7 more lines)" line
@@ -65,8 +78,7 @@ class TestPrintToolResultOutput:
         assert "7 more lines" in lines[-1]
 
     def test_verbosity_1_shows_5_lines(self, capsys):
-        output = "\n".join(f"line {i}" for i in range(10))
-        print_tool_result_output(output, verbose=1)
+        print_tool_result_output(_TEN_LINES, verbose=1)
         captured = capsys.readouterr().out
         lines = [l for l in captured.strip().splitlines() if l.strip()]
         # 5 content lines + 1 "... (5 more lines)" line
@@ -74,8 +86,7 @@ class TestPrintToolResultOutput:
         assert "5 more lines" in lines[-1]
 
     def test_verbosity_2_shows_all(self, capsys):
-        output = "\n".join(f"line {i}" for i in range(10))
-        print_tool_result_output(output, verbose=2)
+        print_tool_result_output(_TEN_LINES, verbose=2)
         captured = capsys.readouterr().out
         lines = [l for l in captured.strip().splitlines() if l.strip()]
         assert len(lines) == 10
@@ -84,3 +95,23 @@ class TestPrintToolResultOutput:
         print_tool_result_output("", verbose=0)
         captured = capsys.readouterr().out
         assert captured == ""
+
+    def test_crlf_output_counts_and_strips_carriage_returns(self, capsys):
+        output = "\r\n".join(f"line {i}" for i in range(10))
+        print_tool_result_output(output, verbose=0)
+        captured = capsys.readouterr().out
+        assert "\r" not in captured
+        assert "7 more lines" in captured
+
+    def test_single_write(self):
+        with patch("builtins.print") as mock_print:
+            print_tool_result_output(_TEN_LINES, verbose=1)
+        assert mock_print.call_count == 1
+
+    def test_color_codes_wrap_each_line(self, capsys):
+        print_tool_result_output("a\nb", verbose=2)
+        assert capsys.readouterr().out == f"{DIM}    a{RESET}\n{DIM}    b{RESET}\n"
+
+    def test_reset_in_output_does_not_undim_later_lines(self, capsys):
+        print_tool_result_output(f"a{RESET}\nb", verbose=2)
+        assert capsys.readouterr().out.split("\n")[1] == f"{DIM}    b{RESET}"